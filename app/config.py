@@ -13,6 +13,16 @@ DROPBOX_REFRESH_TOKEN = os.getenv("DROPBOX_REFRESH_TOKEN", "")
 DROPBOX_APP_KEY = os.getenv("DROPBOX_APP_KEY", "0tyemk1osl7a0x1")
 DROPBOX_APP_SECRET = os.getenv("DROPBOX_APP_SECRET", "0ltp3dkj081hoos")
 
+# Dropbox access token 선제 갱신 주기 (초, 토큰 유효기간 4시간)
+DROPBOX_TOKEN_REFRESH_INTERVAL = 3.5 * 3600
+
+# Dropbox 동시 다운로드 수 (스레드 풀 및 커넥션 풀 크기)
+DROPBOX_DOWNLOAD_CONCURRENCY = int(os.getenv("DROPBOX_DOWNLOAD_CONCURRENCY", "30"))
+
+# 소재 목록 공유 캐시 (Redis, 미설정 시 프로세스 내 캐시만 사용)
+REDIS_URL = os.getenv("REDIS_URL", "")
+MATERIALS_CACHE_TTL = 300  # 초
+
 # Dropbox 경로
 DROPBOX_BASE_PATH = "/광고사업부/4. 광고주/삼성증권/2. 업무/03. 소재/03. 전체 Vari 심의자료/■ 파일 취합본 new/파이썬용"
 DROPBOX_OUTPUT_PATH = "/광고사업부/4. 광고주/삼성증권/2. 업무/03. 소재/03. 전체 Vari 심의자료/준법,협회 심의자료 ppt/파이썬 결과"
@@ -21,10 +31,39 @@ DROPBOX_OUTPUT_PATH = "/광고사업부/4. 광고주/삼성증권/2. 업무/03.
 SPREADSHEET_URL = "https://docs.google.com/spreadsheets/d/1lIn2bd7bwlWpKedwmswJieTBlfzTkMNxMNmNw5dX_Bo/edit"
 OBJECT_SPREADSHEET_URL = "https://docs.google.com/spreadsheets/d/13yRJbD6THRP5ZS-jTSPoKtdj_ULcPaFTkv9h8eJYR7E/edit"
 
+# 생성된 PPT 보관 (다운로드 대기, 개수 및 만료 시간)
+PPT_RESULT_CACHE = int(os.getenv("PPT_RESULT_CACHE", "64"))
+PPT_RESULT_TTL = 900  # 초
+
+# 생성된 PPT를 메모리에 유지할 최대 크기 (초과분은 임시 파일로 기록)
+PPT_SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
 # 프로젝트 경로
 BASE_DIR = Path(__file__).parent.parent
 CREDENTIALS_DIR = BASE_DIR / "credentials"
 TEMPLATE_PATH = BASE_DIR / "template5.pptx"
 
+# 스프레드시트 스냅샷 캐시 경로 (수정 시각이 같으면 재시작 후에도 API 전체 조회 생략)
+SHEETS_CACHE_DIR = Path(os.getenv("SHEETS_CACHE_DIR", str(BASE_DIR / ".cache" / "sheets")))
+
+# 스프레드시트 메모리 캐시 유지 시간 (초, 만료 후 수정 시각을 확인해 다시 로드)
+SHEETS_CACHE_TTL = 600
+
 # 이미지 확장자
 IMAGE_EXTENSIONS = [".jpg", ".png"]
+
+# PPT에 사용하는 이미지 사이즈 목록
+PPT_IMAGE_SIZES = [
+    '640x100', '970x250', '160x600',
+    '1200x628', '1200x1200', '1200x1500',
+    '1080x1080', '1200x1200_toss',
+    '315x258', '342x228', '112x112',
+    '200x200_toss', '1200x1200_당근',
+    '1200x627_CTAx'
+]
+
+# 소재 목록 조회 후 이미지를 미리 받아둘 소재 수
+PREFETCH_MATERIALS = 20
+
+# 이미지 캐시 최대 용량 (bytes, 기본 160MiB - 1GiB 인스턴스에서 PPT 생성 메모리 여유 확보)
+IMAGE_CACHE_MAX_BYTES = int(os.getenv("IMAGE_CACHE_MAX_BYTES", str(160 * 1024 * 1024)))
@@ -2,39 +2,111 @@
 Dropbox API 클라이언트 모듈 - 캐싱 및 병렬 다운로드 지원
 """
 import dropbox
-from dropbox.files import FileMetadata, FolderMetadata
+from dropbox.files import FileMetadata, FolderMetadata, DeletedMetadata
 from dropbox.common import PathRoot
 from io import BytesIO
-from typing import Optional, List, Dict, Callable
+from collections import OrderedDict
+import asyncio
+import hashlib
+import json
+import logging
+import time
+import uuid
+import zipfile
+from pathlib import PurePosixPath
+from threading import Lock
+from typing import Optional, List, Dict, Callable, Tuple
 import requests
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import httpx
+import msgpack
+import redis
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 
 from . import config
 
+logger = logging.getLogger(__name__)
+
 # 팀 Dropbox root_namespace_id
 ROOT_NAMESPACE_ID = "12114515089"
 
+# 이미지 확장자 매칭용 (str.endswith에 tuple로 한 번에 검사)
+_EXT_TUPLE = tuple(config.IMAGE_EXTENSIONS)
+# 같은 사이즈에 여러 확장자가 있을 때의 우선순위 (download_image의 시도 순서와 동일)
+_EXT_PRIORITY = {ext: i for i, ext in enumerate(config.IMAGE_EXTENSIONS)}
+
+# 한 소재에서 이 개수 이상 받아야 하면 폴더 전체를 zip으로 다운로드
+ZIP_PREFETCH_MIN_SIZES = 3
+
+DROPBOX_TOKEN_URL = "https://api.dropboxapi.com/oauth2/token"
+DROPBOX_DOWNLOAD_URL = "https://content.dropboxapi.com/2/files/download"
+
+# 락 값이 토큰과 같을 때만 삭제 (compare-and-delete)
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+# 공용 HTTP 세션 (keep-alive 커넥션 재사용)
+_HTTP = requests.Session()
+_HTTP.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=20,
+    # 토큰 갱신 POST만 보내므로 POST도 상태코드 재시도 대상에 포함 (기본 allowed_methods에는 POST가 없음)
+    max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504],
+                      allowed_methods=frozenset({"POST"})),
+))
+
+
+def _read_body(response: requests.Response) -> bytes:
+    """
+    SDK 다운로드 응답(stream=True) 본문을 한 번에 읽고 커넥션 반환
+    response.content는 64KiB 청크 리스트를 만든 뒤 join으로 다시 복사하지만,
+    raw.read()는 Content-Length 크기의 bytes 하나에 바로 읽어들임
+    """
+    with response:
+        return response.raw.read(decode_content=True)
+
 
 class DropboxClient:
     """Dropbox API 클라이언트 (캐싱 및 병렬 다운로드 지원)"""
     
+    http: requests.Session = _HTTP  # 테스트 시 교체 가능
+    
     def __init__(self):
         self.access_token: Optional[str] = None
         self._dbx: Optional[dropbox.Dropbox] = None
-        self._image_cache: Dict[str, BytesIO] = {}  # 이미지 캐시
-        self._folder_cache: Dict[str, str] = {}     # 최신 폴더 경로 캐시
+        self._dbx_session: Optional[requests.Session] = None  # SDK 커넥션 풀 (토큰 갱신 후에도 유지)
+        self._async_http: Optional[httpx.AsyncClient] = None
+        self._redis: Optional[redis.Redis] = (
+            redis.Redis.from_url(config.REDIS_URL) if config.REDIS_URL else None
+        )
+        self._image_cache: OrderedDict[str, bytes] = OrderedDict()  # 이미지 캐시 (LRU)
+        self._cache_bytes = 0                       # 이미지 캐시 사용량 (bytes)
+        self._cache_lock = Lock()
+        self._folder_cache: Dict[str, Future] = {}  # 최신 폴더 경로 캐시 (동시 조회 공유)
+        self._folder_lock = Lock()
+        self._prefetch_tasks: Dict[Tuple[str, ...], asyncio.Task] = {}  # 진행 중인 프리페치
+        self._tree: Dict[str, Dict[str, List[str]]] = {}  # 소재 → 날짜 폴더 → 사이즈 트리
+        self._tree_cursor: Optional[str] = None     # 마지막 스캔 커서 (변경분 조회용)
+        self._tree_lock = Lock()
+        self._materials_cached_at = 0.0
         self._refresh_access_token()
     
     def _refresh_access_token(self):
         """Refresh token을 사용해 access token 갱신"""
-        response = requests.post(
-            "https://api.dropboxapi.com/oauth2/token",
+        response = self.http.post(
+            DROPBOX_TOKEN_URL,
             data={
                 "refresh_token": config.DROPBOX_REFRESH_TOKEN,
                 "grant_type": "refresh_token",
                 "client_id": config.DROPBOX_APP_KEY,
                 "client_secret": config.DROPBOX_APP_SECRET,
-            }
+            },
+            timeout=(3.05, 10)
         )
         if response.status_code == 200:
             self.access_token = response.json().get("access_token")
@@ -46,117 +118,315 @@ class DropboxClient:
         """Dropbox 클라이언트 인스턴스 (팀 Dropbox용 path_root 설정)"""
         if not self.access_token:
             self._refresh_access_token()
+        if self._dbx_session is None:
+            # 동시 다운로드 수만큼 커넥션 풀 확보 (SDK 기본 인증서 고정 어댑터 사용)
+            self._dbx_session = dropbox.create_session(max_connections=config.DROPBOX_DOWNLOAD_CONCURRENCY)
+            # 연결 단계 오류만 재시도 (5xx/429 응답은 SDK가 자체적으로 재시도)
+            self._dbx_session.get_adapter("https://").max_retries = Retry(total=3, read=0, backoff_factor=0.3)
         if self._dbx is None:
-            base_dbx = dropbox.Dropbox(self.access_token)
+            # 토큰이 바뀌어도 같은 세션을 넘겨 keep-alive 커넥션 재사용
+            base_dbx = dropbox.Dropbox(self.access_token, session=self._dbx_session)
             self._dbx = base_dbx.with_path_root(PathRoot.root(ROOT_NAMESPACE_ID))
         return self._dbx
     
-    def get_materials_list(self, keyword: Optional[str] = None) -> Dict[str, List[str]]:
-        """키워드로 소재 폴더 목록 조회 (병렬 + 캐싱)"""
-        # 캐시 키 생성
-        cache_key = f"materials_{keyword or 'all'}"
-        if hasattr(self, '_materials_cache') and cache_key in self._materials_cache:
-            cached = self._materials_cache[cache_key]
-            if keyword:
-                return {k: v for k, v in cached.items() if keyword in k}
-            return cached
+    @property
+    def async_http(self) -> httpx.AsyncClient:
+        """비동기 다운로드용 HTTP 클라이언트 (커넥션 풀 공유)"""
+        if self._async_http is None:
+            self._async_http = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=config.DROPBOX_DOWNLOAD_CONCURRENCY,
+                    max_keepalive_connections=config.DROPBOX_DOWNLOAD_CONCURRENCY,
+                ),
+                timeout=httpx.Timeout(30.0, connect=3.05),
+            )
+        return self._async_http
+    
+    def get_materials_list(self, keyword: Optional[str] = None,
+                           loop: Optional[asyncio.AbstractEventLoop] = None) -> Dict[str, List[str]]:
+        """
+        키워드로 소재 폴더 목록 조회 (재귀 스캔 + 캐싱, 만료 후에는 변경분만 반영)
+        loop: 워커 스레드에서 호출할 때 이미지 프리페치를 예약할 이벤트 루프
+        """
+        materials_sizes = self._get_all_materials()
         
-        materials_sizes = {}
+        if keyword:
+            materials_sizes = {k: v for k, v in materials_sizes.items() if keyword in k}
         
-        try:
-            result = self.dbx.files_list_folder(config.DROPBOX_BASE_PATH)
-            
-            # 폴더 목록 추출
-            folders = [
-                entry.name for entry in result.entries 
-                if isinstance(entry, FolderMetadata)
-            ]
-            
-            # 키워드 필터링
-            if keyword:
-                folders = [f for f in folders if keyword in f]
-            
-            # 병렬로 각 폴더 정보 조회
-            def get_folder_info(folder_name):
-                material_path = f"{config.DROPBOX_BASE_PATH}/{folder_name}"
-                latest_folder = self._get_latest_date_folder(material_path)
-                if not latest_folder:
-                    return folder_name, []
-                sizes = self._get_image_sizes(latest_folder)
-                return folder_name, sizes
-            
-            with ThreadPoolExecutor(max_workers=10) as executor:
-                futures = {executor.submit(get_folder_info, f): f for f in folders}
-                
-                for future in as_completed(futures):
-                    folder_name, sizes = future.result()
-                    if sizes:
-                        materials_sizes[folder_name] = sizes
+        self._schedule_prefetch(materials_sizes, loop)
+        return materials_sizes
+    
+    def get_materials_sizes(self, names: List[str]) -> Dict[str, List[str]]:
+        """지정한 소재들의 사이즈 목록 (입력 순서 유지, 없는 소재는 제외)"""
+        all_materials = self._get_all_materials()
+        return {name: all_materials[name] for name in dict.fromkeys(names) if name in all_materials}
+    
+    def _get_all_materials(self) -> Dict[str, List[str]]:
+        """전체 소재 목록 (프로세스 내 캐시 -> 공유 캐시 -> Dropbox 스캔 순)"""
+        # 캐시 키 생성 (스캔은 항상 전체 기준)
+        cache_key = "materials_all"
+        cache_fresh = time.monotonic() - self._materials_cached_at < config.MATERIALS_CACHE_TTL
+        if hasattr(self, '_materials_cache') and cache_key in self._materials_cache and cache_fresh:
+            materials_sizes = self._materials_cache[cache_key]
+        else:
+            # 공유 캐시 조회 (다른 워커가 이미 스캔한 결과 재사용)
+            materials_sizes, lock_token = self._load_shared_materials()
+            if materials_sizes is None:
+                materials_sizes = self._scan_materials(lock_token)
             
-            # 캐시 저장 (전체 목록일 때만)
-            if not keyword:
+            if materials_sizes:
                 if not hasattr(self, '_materials_cache'):
                     self._materials_cache = {}
                 self._materials_cache[cache_key] = materials_sizes
+                self._materials_cached_at = time.monotonic()
+        
+        return materials_sizes
+    
+    def _schedule_prefetch(self, materials_sizes: Dict[str, List[str]],
+                           loop: Optional[asyncio.AbstractEventLoop] = None):
+        """
+        목록 조회 직후 상위 소재 이미지를 백그라운드로 미리 다운로드
+        (loop를 넘기지 않으면 이벤트 루프에서 호출된 경우에만 동작)
+        """
+        if loop is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return
+        
+        materials = tuple(list(materials_sizes)[:config.PREFETCH_MATERIALS])
+        if not materials:
+            return
+        
+        # 소재별로 PPT에 쓰이는 사이즈 중 실제 존재하는 것만 (없는 조합의 409 요청 방지)
+        pairs = [
+            (material, size)
+            for material in materials
+            for size in dict.fromkeys(materials_sizes[material])
+            if size in config.PPT_IMAGE_SIZES
+        ]
+        # 작업 생성 및 진행 중 목록 관리는 이벤트 루프 스레드에서
+        loop.call_soon_threadsafe(self._start_prefetch, loop, materials, pairs)
+    
+    def _start_prefetch(self, loop: asyncio.AbstractEventLoop, materials: Tuple[str, ...],
+                        pairs: List[Tuple[str, str]]):
+        """프리페치 작업 시작 (같은 소재 묶음이 진행 중이면 생략, 이벤트 루프 스레드에서 실행)"""
+        if materials in self._prefetch_tasks:
+            return
+        
+        def on_done(task: asyncio.Task):
+            self._prefetch_tasks.pop(materials, None)
+            if not task.cancelled() and task.exception():
+                logger.error("Error prefetching images", exc_info=task.exception())
+        
+        task = loop.create_task(self.preload_pairs_async(pairs))
+        task.add_done_callback(on_done)
+        self._prefetch_tasks[materials] = task
+    
+    def _scan_materials(self, lock_token: Optional[str] = None) -> Dict[str, List[str]]:
+        """
+        Dropbox 스캔으로 소재별 최신 날짜 폴더의 사이즈 목록 추출
+        lock_token: 공유 캐시 스캔 락을 잡았을 때의 토큰 (저장 후 해제)
+        """
+        materials_sizes = {}
+        latest_dates = {}
+        
+        try:
+            with self._tree_lock:
+                self._sync_tree()
+                
+                for material, dates in self._tree.items():
+                    if not dates:
+                        continue
+                    latest_dates[material] = max(dates)
+                    if dates[latest_dates[material]]:
+                        materials_sizes[material] = list(dates[latest_dates[material]])
                         
-        except Exception as e:
-            print(f"Error listing materials: {e}")
+        except Exception:
+            logger.exception("Error listing materials: %s", config.DROPBOX_BASE_PATH)
         
+        self._set_latest_dates(latest_dates)
+        self._store_shared_materials(materials_sizes, latest_dates, lock_token)
         return materials_sizes
     
-    def _get_latest_date_folder(self, material_path: str) -> Optional[str]:
-        """최신 날짜 폴더 경로 반환 (캐싱)"""
-        if material_path in self._folder_cache:
-            return self._folder_cache[material_path]
+    def _set_latest_dates(self, latest_dates: Dict[str, str]):
+        """소재별 최신 날짜 폴더 경로 캐시 갱신"""
+        changed = []
+        with self._folder_lock:
+            for material, latest_date in latest_dates.items():
+                material_path = f"{config.DROPBOX_BASE_PATH}/{material}"
+                full_path = f"{material_path}/{latest_date}"
+                previous = self._folder_cache.get(material_path)
+                if previous is not None and previous.done() and previous.result() != full_path:
+                    changed.append(material)
+                future = Future()
+                future.set_result(full_path)
+                self._folder_cache[material_path] = future
         
+        # 최신 날짜 폴더가 바뀐 소재는 이전 폴더 이미지를 캐시에서 제거
+        if changed:
+            prefixes = tuple(f"{material}/" for material in changed)
+            with self._cache_lock:
+                for cache_key in [k for k in self._image_cache if k.startswith(prefixes)]:
+                    self._cache_bytes -= len(self._image_cache.pop(cache_key))
+    
+    def _shared_cache_key(self) -> str:
+        """공유 캐시 키 (기준 경로 해시)"""
+        digest = hashlib.sha256(config.DROPBOX_BASE_PATH.encode("utf-8")).hexdigest()
+        return f"autoexamine:materials:{digest}"
+    
+    def _load_shared_materials(self) -> Tuple[Optional[Dict[str, List[str]]], Optional[str]]:
+        """
+        Redis에서 소재 목록 조회 (블로킹 대기가 있으므로 이벤트 루프가 아닌 스레드에서 호출)
+        캐시가 없으면 락을 잡은 워커 하나만 스캔하고, 나머지는 결과가 올라올 때까지 대기
+        Returns:
+            (캐시된 소재 목록, 직접 스캔해야 하면 None), (락을 잡았으면 락 토큰, 아니면 None)
+        """
+        if self._redis is None:
+            return None, None
+        
+        key = self._shared_cache_key()
         try:
-            result = self.dbx.files_list_folder(material_path)
-            date_folders = [
-                entry.name for entry in result.entries 
-                if isinstance(entry, FolderMetadata)
-            ]
-            
-            if not date_folders:
-                return None
+            data = self._redis.get(key)
             
-            latest_date = max(date_folders)
-            full_path = f"{material_path}/{latest_date}"
-            self._folder_cache[material_path] = full_path
-            return full_path
+            # 캐시 없음 → 락 획득 성공 시 직접 스캔, 실패 시 다른 워커의 스캔 결과 대기
+            if data is None:
+                lock_token = uuid.uuid4().hex
+                if self._redis.set(f"{key}:lock", lock_token, nx=True, ex=60):
+                    return None, lock_token
+                deadline = time.monotonic() + 60
+                while data is None and time.monotonic() < deadline:
+                    time.sleep(0.2)
+                    data = self._redis.get(key)
             
-        except Exception as e:
-            print(f"Error finding date folder: {e}")
-            return None
+            if data is not None:
+                cached = msgpack.unpackb(data)
+                self._set_latest_dates(cached["latest_dates"])
+                return cached["materials"], None
+        except redis.RedisError:
+            logger.exception("Error reading materials cache: %s", key)
+        
+        return None, None
     
-    def _get_image_sizes(self, folder_path: str) -> List[str]:
-        """폴더 내 이미지 사이즈 목록"""
-        sizes = []
+    def _store_shared_materials(self, materials_sizes: Dict[str, List[str]],
+                                latest_dates: Dict[str, str], lock_token: Optional[str] = None):
+        """Redis에 소재 목록 저장 (TTL) 후 직접 잡은 락만 해제"""
+        if self._redis is None:
+            return
         
+        key = self._shared_cache_key()
         try:
-            result = self.dbx.files_list_folder(folder_path)
+            if materials_sizes:
+                data = msgpack.packb({"materials": materials_sizes, "latest_dates": latest_dates})
+                self._redis.set(key, data, ex=config.MATERIALS_CACHE_TTL)
+            if lock_token is not None:
+                # 락 값이 내 토큰일 때만 삭제 (만료 후 다른 워커가 잡은 락은 유지)
+                self._redis.eval(RELEASE_LOCK_SCRIPT, 1, f"{key}:lock", lock_token)
+        except redis.RedisError:
+            logger.exception("Error writing materials cache: %s", key)
+    
+    def _sync_tree(self):
+        """
+        소재 → 날짜 폴더 → 이미지 사이즈 트리 동기화
+        이전 스캔 커서가 있으면 그 이후 변경분만 받아 반영하고, 없거나 만료되면 재귀 목록 조회로 전체 스캔
+        """
+        result = None
+        if self._tree_cursor is not None:
+            try:
+                result = self.dbx.files_list_folder_continue(self._tree_cursor)
+            except dropbox.exceptions.ApiError:
+                logger.warning("Materials cursor expired, rescanning: %s", config.DROPBOX_BASE_PATH)
+        
+        if result is None:
+            self._tree = {}
+            result = self.dbx.files_list_folder(config.DROPBOX_BASE_PATH, recursive=True,
+                                                include_non_downloadable_files=False)
+        
+        while True:
+            self._apply_entries(result.entries)
+            if not result.has_more:
+                break
+            result = self.dbx.files_list_folder_continue(result.cursor)
+        
+        self._tree_cursor = result.cursor
+    
+    def _apply_entries(self, entries):
+        """목록 조회 결과(추가/삭제)를 소재 트리에 반영"""
+        base_depth = len(config.DROPBOX_BASE_PATH.split("/"))
+        tree = self._tree
+        
+        for entry in entries:
+            parts = entry.path_display.split("/")[base_depth:]
+            
+            entry_type = type(entry)
+            
+            if entry_type is FolderMetadata:
+                if len(parts) == 1:
+                    tree.setdefault(parts[0], {})
+                elif len(parts) == 2:
+                    tree.setdefault(parts[0], {}).setdefault(parts[1], [])
+            
+            elif entry_type is FileMetadata and len(parts) == 3:
+                lname = entry.name.lower()
+                if lname.endswith(_EXT_TUPLE):
+                    size = entry.name[:lname.rfind(".")]
+                    sizes = tree.setdefault(parts[0], {}).setdefault(parts[1], [])
+                    if size not in sizes:
+                        sizes.append(size)
+            
+            elif entry_type is DeletedMetadata:
+                if len(parts) == 1:
+                    tree.pop(parts[0], None)
+                elif len(parts) == 2:
+                    tree.get(parts[0], {}).pop(parts[1], None)
+                elif len(parts) == 3:
+                    sizes = tree.get(parts[0], {}).get(parts[1])
+                    size = parts[2].rsplit(".", 1)[0]
+                    if sizes and size in sizes:
+                        sizes.remove(size)
+    
+    def _get_latest_date_folder(self, material_path: str) -> Optional[str]:
+        """최신 날짜 폴더 경로 반환 (캐싱, 같은 경로 동시 조회는 RPC 1회로 합침)"""
+        with self._folder_lock:
+            future = self._folder_cache.get(material_path)
+            do_lookup = future is None
+            if do_lookup:
+                future = Future()
+                self._folder_cache[material_path] = future
+        
+        if do_lookup:
+            full_path = None
+            try:
+                result = self.dbx.files_list_folder(material_path)
+                date_folders = [
+                    entry.name for entry in result.entries 
+                    if isinstance(entry, FolderMetadata)
+                ]
+                
+                if date_folders:
+                    full_path = f"{material_path}/{max(date_folders)}"
+                
+            except Exception:
+                logger.exception("Error finding date folder: %s", material_path)
             
-            for entry in result.entries:
-                if isinstance(entry, FileMetadata):
-                    for ext in config.IMAGE_EXTENSIONS:
-                        if entry.name.lower().endswith(ext):
-                            size = entry.name.rsplit(".", 1)[0]
-                            sizes.append(size)
-                            break
-                            
-        except Exception as e:
-            print(f"Error listing images: {e}")
-        
-        return sizes
-    
-    def download_image(self, material: str, size: str) -> Optional[BytesIO]:
-        """이미지 다운로드 (캐싱 지원)"""
+            # 찾지 못한 경우는 캐시하지 않음 (다음 호출 시 재조회)
+            if full_path is None:
+                with self._folder_lock:
+                    self._folder_cache.pop(material_path, None)
+            future.set_result(full_path)
+        
+        return future.result()
+    
+    def download_image(self, material: str, size: str) -> Optional[bytes]:
+        """이미지 다운로드 (캐싱 지원, 캐시와 같은 bytes 객체를 그대로 반환)"""
         cache_key = f"{material}/{size}"
         
         # 캐시 확인
-        if cache_key in self._image_cache:
-            cached = self._image_cache[cache_key]
-            cached.seek(0)
-            return BytesIO(cached.getvalue())  # 복사본 반환
+        with self._cache_lock:
+            data = self._image_cache.get(cache_key)
+            if data is not None:
+                self._image_cache.move_to_end(cache_key)
+                return data  # 캐시된 bytes는 불변이라 호출자가 수정할 수 없음
         
         material_path = f"{config.DROPBOX_BASE_PATH}/{material}"
         latest_folder = self._get_latest_date_folder(material_path)
@@ -168,14 +438,89 @@ class DropboxClient:
             file_path = f"{latest_folder}/{size}{ext}"
             try:
                 _, response = self.dbx.files_download(file_path)
-                img_bytes = BytesIO(response.content)
-                self._image_cache[cache_key] = img_bytes
-                return BytesIO(response.content)
+                data = _read_body(response)
+                self._cache_image(cache_key, data)
+                return data
             except dropbox.exceptions.ApiError:
                 continue
         
         return None
     
+    async def download_image_async(self, material: str, size: str) -> Optional[bytes]:
+        """이미지 비동기 다운로드 (캐싱 지원, SDK 대신 download 엔드포인트 직접 호출)"""
+        cache_key = f"{material}/{size}"
+        
+        # 캐시 확인
+        with self._cache_lock:
+            data = self._image_cache.get(cache_key)
+            if data is not None:
+                self._image_cache.move_to_end(cache_key)
+                return data
+        
+        material_path = f"{config.DROPBOX_BASE_PATH}/{material}"
+        latest_folder = await asyncio.to_thread(self._get_latest_date_folder, material_path)
+        
+        if not latest_folder:
+            return None
+        
+        for ext in config.IMAGE_EXTENSIONS:
+            file_path = f"{latest_folder}/{size}{ext}"
+            response = await self.async_http.post(
+                DROPBOX_DOWNLOAD_URL,
+                headers={
+                    "Authorization": f"Bearer {self.access_token}",
+                    "Dropbox-API-Arg": json.dumps({"path": file_path}),
+                    "Dropbox-API-Path-Root": json.dumps({".tag": "root", "root": ROOT_NAMESPACE_ID}),
+                },
+            )
+            if response.status_code == 409:  # path/not_found 등 API 에러
+                continue
+            response.raise_for_status()
+            data = response.content
+            self._cache_image(cache_key, data)
+            return data
+        
+        return None
+    
+    def _cache_image(self, cache_key: str, data: bytes):
+        """이미지 캐시 저장 (용량 초과 시 오래된 항목부터 제거)"""
+        with self._cache_lock:
+            old = self._image_cache.pop(cache_key, None)
+            if old is not None:
+                self._cache_bytes -= len(old)
+            self._image_cache[cache_key] = data
+            self._cache_bytes += len(data)
+            
+            while self._cache_bytes > config.IMAGE_CACHE_MAX_BYTES and len(self._image_cache) > 1:
+                _, evicted = self._image_cache.popitem(last=False)
+                self._cache_bytes -= len(evicted)
+    
+    def _missing_images(self, materials: List[str], sizes: List[str]) -> List[Tuple[str, str]]:
+        """캐시에 없는 (소재, 사이즈) 목록 (소재 × 사이즈 전체 조합 기준)"""
+        return self._missing_pairs([(material, size) for material in materials for size in sizes])
+    
+    def _missing_pairs(self, pairs: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+        """캐시에 없는 (소재, 사이즈) 목록 (캐시 키 뷰와의 집합 차로 계산)"""
+        wanted = {f"{material}/{size}" for material, size in pairs}
+        with self._cache_lock:
+            missing = wanted - self._image_cache.keys()
+        # 소재명에는 "/"가 없으므로 첫 구분자로 분리 (정렬해 소재별로 모아 둠)
+        return [tuple(key.split("/", 1)) for key in sorted(missing)]
+    
+    def _split_cached(self, pairs: List[Tuple[str, str]]
+                      ) -> Tuple[Dict[Tuple[str, str], bytes], List[Tuple[str, str]]]:
+        """(소재, 사이즈) 목록을 캐시에 있는 이미지와 캐시에 없는 목록(정렬)으로 분리"""
+        images = {}
+        missing = []
+        with self._cache_lock:
+            for material, size in dict.fromkeys(pairs):
+                data = self._image_cache.get(f"{material}/{size}")
+                if data is None:
+                    missing.append((material, size))
+                else:
+                    images[(material, size)] = data
+        return images, sorted(missing)
+    
     def preload_images(self, materials: List[str], sizes: List[str], 
                        progress_callback: Optional[Callable] = None) -> int:
         """
@@ -187,57 +532,210 @@ class DropboxClient:
         Returns:
             다운로드된 이미지 수
         """
-        download_tasks = []
-        
-        # 다운로드할 이미지 목록 생성
-        for material in materials:
-            for size in sizes:
-                cache_key = f"{material}/{size}"
-                if cache_key not in self._image_cache:
-                    download_tasks.append((material, size))
-        
+        return len(self._preload_pairs(self._missing_images(materials, sizes), progress_callback))
+    
+    def _preload_pairs(self, download_tasks: List[Tuple[str, str]],
+                       progress_callback: Optional[Callable] = None) -> Dict[Tuple[str, str], bytes]:
+        """
+        (소재, 사이즈) 목록 병렬 다운로드 후 캐시 저장
+        Returns:
+            {(소재, 사이즈): 이미지 bytes} - 캐시 용량 제한으로 밀려나도 결과에는 남음
+        """
         total = len(download_tasks)
         if total == 0:
-            return 0
+            return {}
+        
+        # 소재별로 묶어서 많이 받아야 하는 소재는 zip 한 번으로 처리
+        sizes_by_material: Dict[str, List[str]] = {}
+        for material, size in download_tasks:
+            sizes_by_material.setdefault(material, []).append(size)
+        
+        jobs = []
+        for material, material_sizes in sizes_by_material.items():
+            if len(material_sizes) >= ZIP_PREFETCH_MIN_SIZES:
+                jobs.append((material, material_sizes))
+            else:
+                jobs.extend((material, [size]) for size in material_sizes)
         
         downloaded = 0
+        images: Dict[Tuple[str, str], bytes] = {}
         
-        def download_one(task):
-            material, size = task
-            return material, size, self.download_image(material, size)
+        def download_one(job):
+            material, job_sizes = job
+            found = {}
+            if len(job_sizes) >= ZIP_PREFETCH_MIN_SIZES:
+                try:
+                    folder_images = self.prefetch_material_folder(material, job_sizes)
+                    found = {(material, size): data for size, data in folder_images.items()}
+                except dropbox.exceptions.DropboxException:
+                    logger.exception("Error downloading folder zip: %s", material)
+            # zip에 없었거나 개별로 받을 사이즈
+            for size in job_sizes:
+                if (material, size) in found:
+                    continue
+                try:
+                    data = self.download_image(material, size)
+                except Exception:
+                    logger.exception("Error downloading image: %s/%s", material, size)
+                    continue
+                if data:
+                    found[(material, size)] = data
+            return job, found
         
-        # 병렬 다운로드 (최대 5개 동시)
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = {executor.submit(download_one, task): task for task in download_tasks}
+        # 병렬 다운로드
+        with ThreadPoolExecutor(max_workers=config.DROPBOX_DOWNLOAD_CONCURRENCY) as executor:
+            futures = {executor.submit(download_one, job): job for job in jobs}
             
             for future in as_completed(futures):
-                material, size, result = future.result()
-                downloaded += 1
+                (material, job_sizes), found = future.result()
+                images.update(found)
+                downloaded += len(job_sizes)
                 
                 if progress_callback:
-                    progress_callback(downloaded, total, f"📥 {material} - {size}")
+                    label = job_sizes[0] if len(job_sizes) == 1 else f"{len(job_sizes)}개 사이즈"
+                    progress_callback(downloaded, total, f"📥 {material} - {label}")
+        
+        return images
+    
+    def download_images_bulk(self, pairs: List[Tuple[str, str]],
+                             progress_callback: Optional[Callable] = None) -> Dict[Tuple[str, str], bytes]:
+        """
+        (소재, 사이즈) 목록 일괄 다운로드 (여러 사이즈가 필요한 소재는 폴더 zip 한 번으로)
+        Args:
+            pairs: (소재, 사이즈) 목록
+            progress_callback: 진행 콜백 (current, total, message)
+        Returns:
+            {(소재, 사이즈): 이미지 bytes} - 찾지 못한 이미지는 제외
+        """
+        # 캐시 적중분은 먼저 꺼내 두고, 나머지는 다운로드 결과에서 바로 채움 (캐시에서 밀려나도 재다운로드 없음)
+        images, missing = self._split_cached(pairs)
+        try:
+            images.update(self._preload_pairs(missing, progress_callback))
+        except Exception:
+            logger.exception("Error preloading images: %d pairs", len(missing))
+        return images
+    
+    async def download_images_bulk_async(self, pairs: List[Tuple[str, str]],
+                                         progress_callback: Optional[Callable] = None
+                                         ) -> Dict[Tuple[str, str], bytes]:
+        """download_images_bulk의 비동기 버전 (이벤트 루프에서 병렬 다운로드)"""
+        images, missing = self._split_cached(pairs)
+        images.update(await self._download_pairs_async(missing, progress_callback))
+        return images
+    
+    def prefetch_material_folder(self, material: str, sizes: List[str]) -> Dict[str, bytes]:
+        """
+        소재의 최신 날짜 폴더를 zip 한 번으로 받아 요청한 사이즈만 이미지 캐시에 저장
+        Args:
+            material: 소재명
+            sizes: 캐시할 사이즈 목록 (그 외 파일은 버림)
+        Returns:
+            {사이즈: 이미지 bytes}
+        """
+        material_path = f"{config.DROPBOX_BASE_PATH}/{material}"
+        latest_folder = self._get_latest_date_folder(material_path)
+        
+        if not latest_folder:
+            return {}
+        
+        _, response = self.dbx.files_download_zip(latest_folder)
+        
+        wanted = set(sizes)
+        images = {}
+        with zipfile.ZipFile(BytesIO(_read_body(response))) as zf:
+            # 사이즈별로 우선순위가 가장 높은 확장자의 파일 하나만 선택
+            chosen: Dict[str, Tuple[int, str]] = {}
+            for name in zf.namelist():
+                # zip 내부 경로는 "날짜폴더/파일명" - 하위 폴더의 파일은 제외
+                if name.count("/") != 1:
+                    continue
+                path = PurePosixPath(name)
+                priority = _EXT_PRIORITY.get(path.suffix.lower())
+                if priority is None or path.stem not in wanted:
+                    continue
+                if path.stem not in chosen or priority < chosen[path.stem][0]:
+                    chosen[path.stem] = (priority, name)
+            
+            for size, (_, name) in chosen.items():
+                data = zf.read(name)
+                self._cache_image(f"{material}/{size}", data)
+                images[size] = data
+        
+        return images
+    
+    async def preload_images_async(self, materials: List[str], sizes: List[str],
+                                   progress_callback: Optional[Callable] = None) -> int:
+        """
+        이미지 비동기 병렬 프리로드 (캐싱)
+        Args:
+            materials: 소재 목록
+            sizes: 다운로드할 사이즈 목록
+            progress_callback: 진행 콜백 (current, total, message)
+        Returns:
+            다운로드된 이미지 수
+        """
+        return await self.preload_pairs_async(self._missing_images(materials, sizes), progress_callback)
+    
+    async def preload_pairs_async(self, pairs: List[Tuple[str, str]],
+                                  progress_callback: Optional[Callable] = None) -> int:
+        """(소재, 사이즈) 목록 중 캐시에 없는 것만 비동기 병렬 다운로드 후 캐시 저장"""
+        return len(await self._download_pairs_async(self._missing_pairs(pairs), progress_callback))
+    
+    async def _download_pairs_async(self, download_tasks: List[Tuple[str, str]],
+                                    progress_callback: Optional[Callable] = None
+                                    ) -> Dict[Tuple[str, str], bytes]:
+        """(소재, 사이즈) 목록 비동기 병렬 다운로드 (캐시 저장, 받은 bytes 반환)"""
+        total = len(download_tasks)
+        if total == 0:
+            return {}
+        
+        downloaded = 0
+        images: Dict[Tuple[str, str], bytes] = {}
+        # 커넥션 풀 크기만큼만 동시 실행 (풀 대기 타임아웃으로 실패하지 않도록)
+        semaphore = asyncio.Semaphore(config.DROPBOX_DOWNLOAD_CONCURRENCY)
+        
+        async def download_one(material: str, size: str):
+            nonlocal downloaded
+            try:
+                async with semaphore:
+                    data = await self.download_image_async(material, size)
+                if data:
+                    images[(material, size)] = data
+            except httpx.HTTPError:
+                logger.exception("Error downloading image: %s/%s", material, size)
+            downloaded += 1
+            
+            if progress_callback:
+                progress_callback(downloaded, total, f"📥 {material} - {size}")
         
-        return downloaded
+        await asyncio.gather(*(download_one(m, s) for m, s in download_tasks))
+        return images
     
     def clear_cache(self):
         """캐시 초기화"""
-        self._image_cache.clear()
-        self._folder_cache.clear()
+        for task in list(self._prefetch_tasks.values()):
+            task.cancel()
+        self._prefetch_tasks.clear()
+        with self._cache_lock:
+            self._image_cache.clear()
+            self._cache_bytes = 0
+        with self._folder_lock:
+            self._folder_cache.clear()
     
     def upload_ppt(self, ppt_bytes: BytesIO, filename: str) -> Optional[str]:
         """PPT 파일을 Dropbox에 업로드"""
         upload_path = f"{config.DROPBOX_OUTPUT_PATH}/{filename}"
         
         try:
-            ppt_bytes.seek(0)
+            # SDK는 bytes만 허용 - getvalue()는 내부 버퍼를 복사 없이 공유
             self.dbx.files_upload(
-                ppt_bytes.read(),
+                ppt_bytes.getvalue(),
                 upload_path,
                 mode=dropbox.files.WriteMode.overwrite
             )
             return upload_path
-        except Exception as e:
-            print(f"Error uploading PPT: {e}")
+        except Exception:
+            logger.exception("Error uploading PPT: %s", upload_path)
             return None
 
 
@@ -2,19 +2,37 @@
 FastAPI 웹 서버 메인 모듈 - SSE 실시간 진행상황 지원
 """
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import StreamingResponse, HTMLResponse
+from fastapi.responses import Response, StreamingResponse, HTMLResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.templating import Jinja2Templates
+from starlette.background import BackgroundTask
 from pathlib import Path
-import traceback
-import json
+import hashlib
+import logging
+import os
+import queue
+import orjson
 import asyncio
-from typing import List
-from queue import Queue
-from threading import Thread
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from typing import List, Optional
+from threading import Thread, Lock
+from cachetools import TTLCache
 
+from . import config
 from .ppt_generator import PPTGenerator
 from .dropbox_client import get_dropbox_client
+from .sheets_client import get_sheets_client
+
+# 로그는 큐에 넣고 별도 스레드에서 출력 (다운로드/생성 스레드가 stderr 쓰기로 막히지 않도록)
+log_queue: queue.SimpleQueue = queue.SimpleQueue()
+log_listener = QueueListener(log_queue, logging.StreamHandler())
+log_listener.handlers[0].setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO"), handlers=[QueueHandler(log_queue)])
+log_listener.start()
+logging.getLogger("httpx").setLevel(logging.WARNING)  # 이미지 다운로드 요청마다 남는 로그 억제
+logger = logging.getLogger(__name__)
 
 # FastAPI 앱 생성
 app = FastAPI(
@@ -23,13 +41,69 @@ app = FastAPI(
     version="2.0.0"
 )
 
+class SelectiveGZipMiddleware(GZipMiddleware):
+    """gzip 압축 (SSE 스트림은 버퍼링되면 안 되고, PPT는 이미 zip이라 제외)"""
+    
+    EXCLUDED_PATHS = ("/api/generate", "/api/download/")  # /api/generate-sse 포함
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith(self.EXCLUDED_PATHS):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+app.add_middleware(SelectiveGZipMiddleware, minimum_size=1024)
+
 # 정적 파일 및 템플릿 설정
 BASE_DIR = Path(__file__).parent
 app.mount("/static", StaticFiles(directory=BASE_DIR / "static"), name="static")
 templates = Jinja2Templates(directory=BASE_DIR / "templates")
 
-# PPT 결과 저장용 딕셔너리
-ppt_results = {}
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# PPT 결과 저장용 캐시 (다운로드되지 않은 결과는 만료 후 제거)
+ppt_results = TTLCache(maxsize=config.PPT_RESULT_CACHE, ttl=config.PPT_RESULT_TTL)
+ppt_results_lock = Lock()
+
+
+def sse_event(msg: dict) -> bytes:
+    """SSE 이벤트 프레임 생성 (orjson은 UTF-8 bytes를 바로 반환)"""
+    return b"data: " + orjson.dumps(msg) + b"\n\n"
+
+
+@app.on_event("startup")
+async def warm_up():
+    """시작 시 Dropbox/Sheets 클라이언트(OAuth 토큰) 및 스프레드시트 캐시 초기화, 토큰 선제 갱신 작업 시작"""
+    try:
+        await asyncio.to_thread(get_dropbox_client)
+    except Exception:
+        logger.exception("Error warming up Dropbox client")
+    try:
+        sheets_client = await asyncio.to_thread(get_sheets_client)
+        await asyncio.to_thread(sheets_client.warmup)  # 두 스프레드시트 선로드
+    except Exception:
+        logger.exception("Error warming up Sheets client")
+    app.state.refresh_task = asyncio.create_task(refresh_dropbox_token_loop())
+
+
+@app.on_event("shutdown")
+async def shut_down():
+    """토큰 갱신 작업 및 로그 출력 스레드 종료"""
+    app.state.refresh_task.cancel()
+    log_listener.stop()
+
+
+async def refresh_dropbox_token_loop():
+    """Dropbox access token 만료 전에 주기적으로 갱신 (요청 경로에서 갱신 지연 제거)"""
+    while True:
+        await asyncio.sleep(config.DROPBOX_TOKEN_REFRESH_INTERVAL)
+        try:
+            client = await asyncio.to_thread(get_dropbox_client)
+            await asyncio.to_thread(client._refresh_access_token)
+            client._dbx = None  # 새 토큰으로 SDK 클라이언트 재생성
+        except Exception:
+            logger.exception("Error refreshing Dropbox token")
 
 
 @app.get("/", response_class=HTMLResponse)
@@ -38,40 +112,51 @@ async def index(request: Request):
     return templates.TemplateResponse("index.html", {"request": request})
 
 
-@app.get("/api/all-materials")
-async def get_all_materials():
+@lru_cache(maxsize=256)
+def normalize_keyword(keyword: str) -> Optional[str]:
+    """검색 키워드 정규화 (공백 제거, 빈 값은 None)"""
+    keyword = keyword.strip()
+    return keyword or None
+
+
+@app.get("/api/all-materials", response_class=ORJSONResponse)
+async def get_all_materials(request: Request):
     """전체 소재 목록 조회 API"""
-    try:
-        client = get_dropbox_client()
-        materials = client.get_materials_list(None)
-        
-        return {
-            "success": True,
-            "count": len(materials),
-            "materials": list(materials.keys()),
-            "details": {name: sizes for name, sizes in materials.items()}
-        }
-    except Exception as e:
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=str(e))
+    return await materials_response(request, "", cache_control="public, max-age=60")
 
 
-@app.get("/api/materials")
-async def get_materials(keyword: str = ""):
+@app.get("/api/materials", response_class=ORJSONResponse)
+async def get_materials(request: Request, keyword: str = ""):
     """소재 목록 조회 API (키워드 필터)"""
+    return await materials_response(request, keyword)
+
+
+async def materials_response(request: Request, keyword: str, cache_control: str = "no-cache") -> Response:
+    """소재 목록 응답 생성 (ETag 일치 시 304)"""
     try:
-        client = get_dropbox_client()
-        materials = client.get_materials_list(keyword if keyword else None)
+        # 스캔/공유 캐시 대기는 블로킹이므로 스레드에서 실행 (프리페치는 이 이벤트 루프에 예약)
+        loop = asyncio.get_running_loop()
+        materials = await asyncio.to_thread(
+            lambda: get_dropbox_client().get_materials_list(normalize_keyword(keyword), loop=loop)
+        )
         
-        return {
+        # 소재명 목록은 details의 키와 같으므로 별도로 보내지 않음 (프론트에서 Object.keys 사용)
+        body = orjson.dumps({
             "success": True,
             "keyword": keyword,
             "count": len(materials),
-            "materials": list(materials.keys()),
-            "details": {name: sizes for name, sizes in materials.items()}
-        }
+            "details": materials
+        })
     except Exception as e:
+        logger.exception("Error listing materials: %s", keyword)
         raise HTTPException(status_code=500, detail=str(e))
+    
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @app.get("/api/generate-sse")
@@ -85,11 +170,16 @@ async def generate_sse(materials: str = ""):
     selected_materials = [m.strip() for m in materials.split(",") if m.strip()]
     
     async def event_generator():
-        progress_queue = Queue()
+        loop = asyncio.get_running_loop()
+        progress_queue: asyncio.Queue = asyncio.Queue()
         result_holder = {"ppt": None, "error": None}
         
+        def push(msg: dict):
+            # 워커 스레드에서도 안전하게 이벤트 루프 큐에 전달
+            loop.call_soon_threadsafe(progress_queue.put_nowait, msg)
+        
         def send_progress(step: str, current: int, total: int, detail: str = ""):
-            progress_queue.put({
+            push({
                 "type": "progress",
                 "step": step,
                 "current": current,
@@ -103,38 +193,37 @@ async def generate_sse(materials: str = ""):
                 generator = PPTGenerator()
                 ppt_buffer = generator.generate_with_progress(
                     selected_materials, 
-                    progress_callback=send_progress
+                    progress_callback=send_progress,
+                    loop=loop
                 )
                 result_holder["ppt"] = ppt_buffer
             except Exception as e:
                 result_holder["error"] = str(e)
-                traceback.print_exc()
+                logger.exception("Error generating PPT: %d materials", len(selected_materials))
             finally:
-                progress_queue.put({"type": "done"})
+                push({"type": "done"})
         
-        # 백그라운드 스레드에서 PPT 생성
+        # 백그라운드 스레드에서 PPT 생성 (이미지 다운로드는 이벤트 루프에서 비동기 실행)
         thread = Thread(target=generate_in_thread)
         thread.start()
         
-        # SSE 이벤트 스트리밍
+        # SSE 이벤트 스트리밍 (메시지가 들어오는 즉시 전송)
         while True:
-            await asyncio.sleep(0.1)
+            msg = await progress_queue.get()
             
-            while not progress_queue.empty():
-                msg = progress_queue.get()
-                
-                if msg["type"] == "done":
-                    if result_holder["error"]:
-                        yield f"data: {json.dumps({'type': 'error', 'message': result_holder['error']}, ensure_ascii=False)}\n\n"
-                    else:
-                        # PPT를 임시 저장하고 다운로드 토큰 생성
-                        import uuid
-                        token = str(uuid.uuid4())
-                        ppt_results[token] = result_holder["ppt"]
-                        yield f"data: {json.dumps({'type': 'complete', 'token': token, 'filename': f'심의자료_{len(selected_materials)}개소재.pptx'}, ensure_ascii=False)}\n\n"
-                    return
+            if msg["type"] == "done":
+                if result_holder["error"]:
+                    yield sse_event({'type': 'error', 'message': result_holder['error']})
                 else:
-                    yield f"data: {json.dumps(msg, ensure_ascii=False)}\n\n"
+                    # PPT를 임시 저장하고 다운로드 토큰 생성
+                    import uuid
+                    token = str(uuid.uuid4())
+                    with ppt_results_lock:
+                        ppt_results[token] = result_holder["ppt"]
+                    yield sse_event({'type': 'complete', 'token': token, 'filename': f'심의자료_{len(selected_materials)}개소재.pptx'})
+                return
+            else:
+                yield sse_event(msg)
     
     return StreamingResponse(
         event_generator(),
@@ -150,10 +239,12 @@ async def generate_sse(materials: str = ""):
 @app.get("/api/download/{token}")
 async def download_ppt(token: str):
     """생성된 PPT 다운로드"""
-    if token not in ppt_results:
-        raise HTTPException(status_code=404, detail="PPT를 찾을 수 없습니다. 다시 생성해주세요.")
+    with ppt_results_lock:
+        ppt_buffer = ppt_results.pop(token, None)  # 다운로드 후 삭제
+    
+    if ppt_buffer is None:
+        raise HTTPException(status_code=404, detail="PPT를 찾을 수 없거나 보관 시간이 만료되었습니다. 다시 생성해주세요.")
     
-    ppt_buffer = ppt_results.pop(token)  # 다운로드 후 삭제
     ppt_buffer.seek(0)
     
     # 파일명 인코딩 (한글 지원)
@@ -162,11 +253,12 @@ async def download_ppt(token: str):
     encoded_filename = quote(filename)
     
     return StreamingResponse(
-        ppt_buffer,
+        iter(lambda: ppt_buffer.read(DOWNLOAD_CHUNK_SIZE), b""),
         media_type="application/vnd.openxmlformats-officedocument.presentationml.presentation",
         headers={
             "Content-Disposition": f"attachment; filename*=UTF-8''{encoded_filename}"
-        }
+        },
+        background=BackgroundTask(ppt_buffer.close)
     )
 
 
@@ -188,16 +280,17 @@ async def generate(keyword: str = "", materials: str = ""):
             filename = f"{keyword}.pptx"
         
         return StreamingResponse(
-            ppt_buffer,
+            iter(lambda: ppt_buffer.read(DOWNLOAD_CHUNK_SIZE), b""),
             media_type="application/vnd.openxmlformats-officedocument.presentationml.presentation",
             headers={
                 "Content-Disposition": f'attachment; filename="{filename}"'
-            }
+            },
+            background=BackgroundTask(ppt_buffer.close)
         )
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
-        traceback.print_exc()
+        logger.exception("Error generating PPT: keyword=%s", keyword)
         raise HTTPException(status_code=500, detail=f"PPT 생성 중 오류: {str(e)}")
 
 
@@ -4,14 +4,214 @@ PPT 생성 모듈 - 6가지 슬라이드 유형 생성
 from pptx import Presentation
 from pptx.util import Cm, Pt
 from pptx.dml.color import RGBColor
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.opc.serialized import _ZipPkgWriter
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls
+from xml.sax.saxutils import escape
 from io import BytesIO
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, BinaryIO, Tuple, Callable
+import asyncio
+import hashlib
+import re
+import logging
+import tempfile
+import zipfile
 import pandas as pd
 
 from . import config
 from .dropbox_client import get_dropbox_client
 from .sheets_client import get_sheets_client
 
+logger = logging.getLogger(__name__)
+
+# cm/pt -> EMU 변환 계수 (Cm()/Pt() 객체를 만들지 않고 정수 연산으로 변환)
+EMU_PER_CM = int(Cm(1))
+EMU_PER_PT = int(Pt(1))
+
+
+def _emu(*values: float) -> Tuple[int, ...]:
+    """cm 값들을 EMU 정수로 변환"""
+    return tuple(int(v * EMU_PER_CM) for v in values)
+
+
+# 이미 압축된 형식이라 zip에서 다시 압축하지 않는 미디어 확장자
+STORED_MEDIA_EXTENSIONS = (".png", ".jpg", ".jpeg", ".gif")
+
+
+def _write_pkg_member(self, pack_uri, blob):
+    """pptx zip 멤버 기록 (이미지는 무압축 저장, XML 등은 deflate level 1로 빠르게 압축)"""
+    if pack_uri.membername.lower().endswith(STORED_MEDIA_EXTENSIONS):
+        self._zipf.writestr(pack_uri.membername, blob, compress_type=zipfile.ZIP_STORED)
+    else:
+        self._zipf.writestr(pack_uri.membername, blob, compresslevel=1)
+
+
+_ZipPkgWriter.write = _write_pkg_member
+
+# 텍스트박스 XML (python-pptx add_textbox와 같은 구조, 기본으로 생성되는 첫 문단에 텍스트 기록)
+TEXTBOX_TEMPLATE = (
+    '<p:sp %s><p:nvSpPr><p:cNvPr id="{id}" name="TextBox {name_id}"/><p:cNvSpPr txBox="1"/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr><a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+    '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/></p:spPr>'
+    '<p:txBody><a:bodyPr wrap="none"><a:spAutoFit/></a:bodyPr><a:lstStyle/><a:p>{runs}</a:p></p:txBody></p:sp>'
+) % nsdecls("a", "p")
+# 글꼴 속성 (문단 기본값이 아닌 run 단위로 지정해야 PowerPoint에 적용됨)
+FONT_PROPERTIES = (
+    '<a:{tag} sz="{sz}"><a:solidFill><a:srgbClr val="{rgb}"/></a:solidFill>'
+    '<a:latin typeface="Malgun Gothic"/></a:{tag}>'
+)
+LINE_BREAK = re.compile("\n|\v")
+CTRL_CHARS = re.compile(r"([\x00-\x08\x0B-\x1F])")
+
+
+def _text_runs_xml(text: str, sz: int, rgb: str) -> str:
+    """
+    줄바꿈을 <a:br>로 나눈 run XML (빈 run은 생략, 제어문자는 _xHHHH_로 표기)
+    빈 줄/마지막 줄도 같은 글자 크기를 갖도록 <a:br>와 문단 끝(endParaRPr)에도 글꼴 속성 지정
+    """
+    r_pr = FONT_PROPERTIES.format(tag="rPr", sz=sz, rgb=rgb)
+    runs = []
+    for idx, line in enumerate(LINE_BREAK.split(text)):
+        if idx > 0:
+            runs.append(f"<a:br>{r_pr}</a:br>")
+        if line:
+            line = CTRL_CHARS.sub(lambda m: "_x%04X_" % ord(m.group(1)), line)
+            runs.append(f"<a:r>{r_pr}<a:t>{escape(line)}</a:t></a:r>")
+    runs.append(FONT_PROPERTIES.format(tag="endParaRPr", sz=sz, rgb=rgb))
+    return "".join(runs)
+
+
+# PPT 템플릿 원본 (요청마다 파일을 다시 읽지 않도록 bytes로 보관)
+_TEMPLATE_BYTES: Optional[bytes] = config.TEMPLATE_PATH.read_bytes() if config.TEMPLATE_PATH.exists() else None
+
+# 슬라이드 유형별 배치 정의
+# - per_slide: 슬라이드 한 장에 들어가는 소재 수 (col은 그 중 몇 번째 소재인지)
+# - items는 정의된 순서대로 추가됨 (도형 순서 = z-order)
+#   image: (사이즈, left, top, width, height)
+#   text: 오브젝트형 에셋 컬럼 값 (wrap 글자수에서 줄바꿈, suffix 덧붙임, deck_first면 전체 첫 소재 값)
+#   gfa_desc: 네이버GFA 설명문구 1~3 결합 / meta_text, toss_text: META, 토스 모먼트탭 텍스트
+#   google_tables: 구글 AC 텍스트 테이블
+# - pos/left는 cm 단위로 정의하고 import 시 EMU 정수로 변환해 둠
+SLIDE_LAYOUTS: List[Dict[str, Any]] = [
+    {
+        "name": "배너형 슬라이드", "layout": 0, "per_slide": 2,
+        "items": [
+            {"type": "image", "col": 0, "size": "640x100", "pos": (0, 0.7, 18.54, 2.9)},
+            {"type": "image", "col": 0, "size": "970x250", "pos": (0, 7.38, 18.59, 4.79)},
+            {"type": "image", "col": 0, "size": "160x600", "pos": (18.61, 0.7, 4.48, 16.8)},
+            {"type": "image", "col": 1, "size": "640x100", "pos": (0, 3.94, 18.54, 2.9)},
+            {"type": "image", "col": 1, "size": "970x250", "pos": (0, 12.71, 18.59, 4.79)},
+            {"type": "image", "col": 1, "size": "160x600", "pos": (23.09, 0.7, 4.48, 16.8)},
+        ],
+    },
+    {
+        "name": "정사각/세로형 슬라이드", "layout": 1, "per_slide": 2,
+        "items": [
+            {"type": "image", "col": 0, "size": "1200x628", "pos": (0, 0.18, 13.86, 7.25)},
+            {"type": "image", "col": 0, "size": "1200x1200", "pos": (0, 7.62, 7.15, 7.15)},
+            {"type": "image", "col": 0, "size": "1200x1500", "pos": (7.27, 7.62, 6.4, 8)},
+            {"type": "image", "col": 1, "size": "1200x628", "pos": (13.65, 0.18, 13.86, 7.25)},
+            {"type": "image", "col": 1, "size": "1200x1200", "pos": (13.65, 7.62, 7.15, 7.15)},
+            {"type": "image", "col": 1, "size": "1200x1500", "pos": (21.12, 7.62, 6.4, 8)},
+        ],
+    },
+    {
+        "name": "구글 텍스트에셋", "layout": 2, "per_slide": 2, "requires": "google_range_list",
+        "items": [
+            {"type": "image", "col": 0, "size": "1200x628", "pos": (19.15, 8.21, 8.24, 4.31)},
+            {"type": "image", "col": 0, "size": "1200x1200", "pos": (0, 0.18, 7.15, 7.15)},
+            {"type": "image", "col": 0, "size": "1200x1500", "pos": (7.27, 0.18, 6.4, 8)},
+            {"type": "google_tables", "col": 0},
+            {"type": "image", "col": 1, "size": "1200x628", "pos": (19.15, 12.53, 8.24, 4.31)},
+            {"type": "image", "col": 1, "size": "1200x1200", "pos": (13.75, 0.18, 7.15, 7.15)},
+            {"type": "image", "col": 1, "size": "1200x1500", "pos": (21.12, 0.18, 6.4, 8)},
+        ],
+    },
+    {
+        "name": "META/토스 모먼트탭", "layout": 3, "per_slide": 2,
+        "items": [
+            {"type": "image", "col": 0, "size": "1080x1080", "pos": (0.64, 9.49, 6.63, 6.63)},
+            {"type": "meta_text", "col": 0, "left": 0.64},
+            {"type": "image", "col": 0, "size": "1200x1200_toss", "pos": (15.14, 0.5, 5.41, 5.41)},
+            {"type": "toss_text", "col": 0, "left": 15.14},
+            {"type": "image", "col": 1, "size": "1080x1080", "pos": (7.81, 9.49, 6.63, 6.63)},
+            {"type": "meta_text", "col": 1, "left": 7.81},
+            {"type": "image", "col": 1, "size": "1200x1200_toss", "pos": (21.47, 0.5, 5.41, 5.41)},
+            {"type": "toss_text", "col": 1, "left": 21.47},
+        ],
+    },
+    {
+        "name": "오브젝트형", "layout": 4, "per_slide": 1,
+        "items": [
+            # 카카오 비즈보드
+            {"type": "text", "col": 0, "column": "카카오_비즈보드_메인카피", "pos": (1.89, 4.25, 7, 0.92), "font_size": 14},
+            {"type": "text", "col": 0, "column": "카카오_비즈보드_서브카피", "pos": (1.89, 5.0, 7, 0.92), "font_size": 12},
+            {"type": "image", "col": 0, "size": "315x258", "pos": (9.9, 4, 3, 2.3)},
+            # 몰로코 비즈보드
+            {"type": "text", "col": 0, "column": "카카오_비즈보드(몰로코,애피어)_메인카피", "pos": (14.7, 4.25, 7, 0.92), "font_size": 14},
+            {"type": "image", "col": 0, "size": "315x258", "pos": (22.16, 4.25, 3, 2.3)},
+            # 네이버 네이티브
+            {"type": "text", "col": 0, "column": "네이버GFA_네이티브_광고문구", "pos": (1.77, 7.45, 7, 0.92), "font_size": 12},
+            {"type": "text", "col": 0, "column": "네이버GFA_네이티브_설명문구1", "pos": (6.03, 8.53, 7, 0.92), "font_size": 10},
+            {"type": "text", "col": 0, "column": "네이버GFA_네이티브_설명문구2", "pos": (6.03, 9.03, 7, 0.92), "font_size": 10},
+            {"type": "text", "col": 0, "column": "네이버GFA_네이티브_설명문구3", "pos": (6.03, 9.53, 7, 0.92), "font_size": 10},
+            {"type": "image", "col": 0, "size": "342x228", "pos": (1.93, 9, 4, 2.62)},
+            # 네이버 커뮤니케이션애드
+            {"type": "text", "col": 0, "column": "네이버GFA_커뮤니케이션애드_광고문구1", "pos": (12.5, 7.57, 7, 0.92), "font_size": 9.5, "wrap": 23},
+            {"type": "image", "col": 0, "size": "112x112", "pos": (20.21, 8.27, 1.77, 1.77)},
+            {"type": "text", "col": 0, "column": "네이버GFA_커뮤니케이션애드_광고문구2", "pos": (13.79, 10.95, 8, 0.92), "font_size": 9.5, "wrap": 23},
+            # 토스 혜택탭
+            {"type": "image", "col": 0, "size": "200x200_toss", "pos": (1.87, 14.33, 1.27, 1.27)},
+            {"type": "text", "col": 0, "column": "토스_혜택탭_메인문구", "pos": (3.15, 13.34, 7, 0.92), "font_size": 13},
+            {"type": "text", "col": 0, "column": "토스_혜택탭_보조문구", "pos": (3.15, 13.94, 7, 0.92), "font_size": 11.5, "suffix": " AD"},
+            # 당근 네이티브
+            {"type": "image", "col": 0, "size": "1200x1200_당근", "pos": (14.0, 14.46, 2.9, 2.9)},
+            {"type": "text", "col": 0, "column": "당근_당근네이티브_광고 제목", "pos": (17.28, 13.46, 7, 1.05), "font_size": 13.5, "wrap": 20},
+            {"type": "text", "col": 0, "column": "당근_당근네이티브_심의필 문구", "pos": (17.28, 15.29, 7, 1.05), "font_size": 8, "wrap": 20},
+        ],
+    },
+    {
+        "name": "버즈빌/스페셜DA/GFA", "layout": 9, "per_slide": 2,
+        "items": [
+            # 버즈빌 (슬라이드마다 전체 첫 소재의 문구)
+            {"type": "text", "col": 0, "column": "버즈빌_카카오금융_광고 제목", "pos": (2.72, 2.36, 6, 2), "font_size": 9, "deck_first": True},
+            {"type": "image", "col": 0, "size": "1200x627_CTAx", "pos": (2.72, 4.98, 10.34, 5.4)},
+            # 스페셜DA
+            {"type": "text", "col": 0, "column": "카카오_비즈보드_메인카피", "pos": (16.64, 1.75, 4.5, 2), "font_size": 7.5},
+            {"type": "text", "col": 0, "column": "카카오_비즈보드_서브카피", "pos": (16.64, 2.4, 4.5, 2), "font_size": 7.5},
+            {"type": "image", "col": 0, "size": "315x258", "pos": (21.57, 2.04, 2.43, 2)},
+            # GFA 홈피드
+            {"type": "text", "col": 0, "column": "네이버GFA_네이티브_광고문구", "pos": (13.76, 6.8, 7, 2), "font_size": 7},
+            {"type": "gfa_desc", "col": 0, "pos": (13.76, 7.15, 5.94, 2), "font_size": 7.5},
+            {"type": "image", "col": 0, "size": "1200x1200", "pos": (13.61, 9.08, 6.1, 6.1)},
+            {"type": "image", "col": 1, "size": "1200x627_CTAx", "pos": (2.72, 10.63, 10.34, 5.4)},
+            {"type": "text", "col": 1, "column": "카카오_비즈보드_메인카피", "pos": (16.64, 3.93, 4.5, 2), "font_size": 7.5},
+            {"type": "text", "col": 1, "column": "카카오_비즈보드_서브카피", "pos": (16.64, 4.58, 4.5, 2), "font_size": 7.5},
+            {"type": "image", "col": 1, "size": "315x258", "pos": (21.57, 4.23, 2.43, 2)},
+            {"type": "text", "col": 1, "column": "네이버GFA_네이티브_광고문구", "pos": (20.2, 6.8, 7, 2), "font_size": 7},
+            {"type": "gfa_desc", "col": 1, "pos": (20.2, 7.15, 5.94, 2), "font_size": 7.5},
+            {"type": "image", "col": 1, "size": "1200x1200", "pos": (20.2, 9.08, 6.1, 6.1)},
+        ],
+    },
+]
+
+for _spec in SLIDE_LAYOUTS:
+    for _item in _spec["items"]:
+        if "pos" in _item:
+            _item["pos"] = _emu(*_item["pos"])
+        if "left" in _item:
+            _item["left"] = int(_item["left"] * EMU_PER_CM)
+
+# 한 번에 슬라이드를 만드는 소재 수 (유형별 슬라이드당 소재 수의 배수)
+SLIDE_CHUNK = 2
+
+# 줄바꿈해서 넣는 오브젝트형 에셋 컬럼 -> 줄바꿈 글자수
+WRAP_COLUMNS: Dict[str, int] = {
+    item["column"]: item["wrap"]
+    for spec in SLIDE_LAYOUTS for item in spec["items"] if "wrap" in item
+}
+
 
 class PPTGenerator:
     """심의자료 PPT 생성기"""
@@ -24,15 +224,20 @@ class PPTGenerator:
         self.materials: List[str] = []
         self.text_assets: Dict[str, Any] = {}
         self.df_obj_result: Optional[pd.DataFrame] = None
+        self._obj: Dict[str, Dict[str, Any]] = {}
+        self._wrapped: Dict[str, Dict[str, str]] = {}
+        self.images: Dict[Tuple[str, str], bytes] = {}
+        self._image_digests: Dict[Tuple[str, str], bytes] = {}  # (소재, 사이즈) -> sha256
+        self._image_parts: Dict[bytes, Any] = {}  # sha256 -> ImagePart
     
-    def generate(self, keyword: str, progress_callback=None) -> BytesIO:
+    def generate(self, keyword: str, progress_callback=None) -> BinaryIO:
         """
         PPT 생성 메인 함수
         Args:
             keyword: 소재 필터링 키워드 (예: "usp-dm-1st")
             progress_callback: 진행 상태 콜백 함수
         Returns:
-            PPT 파일의 BytesIO 객체
+            PPT 파일 객체 (SpooledTemporaryFile)
         """
         # 1. PPT 템플릿 로드 (BytesIO에서)
         self._load_template()
@@ -45,59 +250,52 @@ class PPTGenerator:
             raise ValueError(f"키워드 '{keyword}'에 해당하는 소재가 없습니다.")
         
         # 3. 텍스트 에셋 로드
-        self.text_assets = self.sheets.get_text_assets(self.materials[0])
-        self.df_obj_result = self.sheets.get_object_assets(self.materials)
+        self._load_text_assets()
         
         # 4. 슬라이드 생성 (6가지 유형)
         self._create_all_slides(progress_callback)
         
-        # 5. BytesIO로 저장
-        ppt_buffer = BytesIO()
-        self.ppt.save(ppt_buffer)
-        ppt_buffer.seek(0)
-        
-        return ppt_buffer
+        # 5. 저장
+        return self._save()
     
-    def generate_with_materials(self, selected_materials: List[str], progress_callback=None) -> BytesIO:
+    def generate_with_materials(self, selected_materials: List[str], progress_callback=None) -> BinaryIO:
         """
         선택된 소재로 PPT 생성
         Args:
             selected_materials: 선택된 소재명 리스트
             progress_callback: 진행 상태 콜백 함수
         Returns:
-            PPT 파일의 BytesIO 객체
+            PPT 파일 객체 (SpooledTemporaryFile)
         """
         # 1. PPT 템플릿 로드
         self._load_template()
         
         # 2. 선택된 소재들의 사이즈 정보 조회
-        all_materials = self.dropbox.get_materials_list(None)
-        self.materials_sizes = {m: all_materials[m] for m in selected_materials if m in all_materials}
-        self.materials = list(self.materials_sizes.keys())
+        self.materials_sizes = self.dropbox.get_materials_sizes(selected_materials)
+        self.materials = list(self.materials_sizes)
         
         if not self.materials:
             raise ValueError("선택된 소재를 찾을 수 없습니다.")
         
         # 3. 텍스트 에셋 로드
-        self.text_assets = self.sheets.get_text_assets(self.materials[0])
-        self.df_obj_result = self.sheets.get_object_assets(self.materials)
+        self._load_text_assets()
         
         # 4. 슬라이드 생성 (6가지 유형)
         self._create_all_slides(progress_callback)
         
-        # 5. BytesIO로 저장
-        ppt_buffer = BytesIO()
-        self.ppt.save(ppt_buffer)
-        ppt_buffer.seek(0)
-        
-        return ppt_buffer
+        # 5. 저장
+        return self._save()
     
-    def generate_with_progress(self, selected_materials: List[str], progress_callback=None) -> BytesIO:
+    def generate_with_progress(self, selected_materials: List[str], progress_callback=None,
+                               loop: Optional[asyncio.AbstractEventLoop] = None,
+                               output: Optional[BinaryIO] = None) -> BinaryIO:
         """
         진행상황 콜백 포함 PPT 생성 (상세 단계별)
         Args:
             selected_materials: 선택된 소재명 리스트
             progress_callback: 콜백(step, current, total, detail)
+            loop: 지정 시 이미지 프리로드를 해당 이벤트 루프에서 비동기로 실행
+            output: PPT를 저장할 파일 객체 (미지정 시 SpooledTemporaryFile)
         """
         def notify(step: str, current: int, total: int, detail: str = ""):
             if progress_callback:
@@ -109,9 +307,8 @@ class PPTGenerator:
         
         # 2. 소재 정보 조회
         notify("소재 조회", 5, 100, f"{len(selected_materials)}개 소재 정보 확인 중...")
-        all_materials = self.dropbox.get_materials_list(None)
-        self.materials_sizes = {m: all_materials[m] for m in selected_materials if m in all_materials}
-        self.materials = list(self.materials_sizes.keys())
+        self.materials_sizes = self.dropbox.get_materials_sizes(selected_materials)
+        self.materials = list(self.materials_sizes)
         
         if not self.materials:
             raise ValueError("선택된 소재를 찾을 수 없습니다.")
@@ -119,202 +316,194 @@ class PPTGenerator:
         # 3. 이미지 프리로드 (병렬)
         notify("이미지 다운로드", 10, 100, "이미지 병렬 다운로드 시작...")
         
-        # 필요한 모든 사이즈 목록
-        all_sizes = [
-            '640x100', '970x250', '160x600',
-            '1200x628', '1200x1200', '1200x1500',
-            '1080x1080', '1200x1200_toss',
-            '315x258', '342x228', '112x112',
-            '200x200_toss', '1200x1200_당근',
-            '1200x627_CTAx'
-        ]
-        
         def img_progress(current, total, msg):
             percent = 10 + int((current / total) * 40)  # 10% ~ 50%
             notify("이미지 다운로드", percent, 100, msg)
         
-        self.dropbox.preload_images(self.materials, all_sizes, img_progress)
+        self._prewarm_images(img_progress, loop)
         
         # 4. 텍스트 에셋 로드
         notify("텍스트 로드", 52, 100, "Google Sheets에서 텍스트 에셋 로드 중...")
-        self.text_assets = self.sheets.get_text_assets(self.materials[0])
-        self.df_obj_result = self.sheets.get_object_assets(self.materials)
+        self._load_text_assets()
         
         # 5. 슬라이드 생성
-        slides_funcs = [
-            ("배너형 슬라이드", self._first_create_slides),
-            ("정사각/세로형 슬라이드", self._second_create_slides),
-            ("구글 텍스트에셋", self._third_create_slides),
-            ("META/토스 모먼트탭", self._fourth_create_slides),
-            ("오브젝트형", self._fifth_create_slides),
-            ("버즈빌/스페셜DA/GFA", self._sixth_create_slides),
-        ]
-        
-        for i, (name, func) in enumerate(slides_funcs):
-            percent = 55 + int((i / len(slides_funcs)) * 40)  # 55% ~ 95%
-            notify("슬라이드 생성", percent, 100, f"📄 {name} 생성 중...")
-            func()
+        self._build_all_slides(notify, 55, 95)  # 55% ~ 95%
         
         # 6. 저장
         notify("완료", 98, 100, "PPT 파일 저장 중...")
-        ppt_buffer = BytesIO()
-        self.ppt.save(ppt_buffer)
-        ppt_buffer.seek(0)
+        ppt_buffer = self._save(output)
         
         notify("완료", 100, 100, "✅ 생성 완료!")
         return ppt_buffer
     
     def _create_all_slides(self, progress_callback=None):
         """모든 슬라이드 유형 생성"""
-        slides_funcs = [
-            ("배너형 슬라이드", self._first_create_slides),
-            ("정사각/세로형 슬라이드", self._second_create_slides),
-            ("구글 텍스트에셋", self._third_create_slides),
-            ("META/토스 모먼트탭", self._fourth_create_slides),
-            ("오브젝트형", self._fifth_create_slides),
-            ("버즈빌/스페셜DA/GFA", self._sixth_create_slides),
-        ]
         
-        total = len(slides_funcs)
-        for i, (name, func) in enumerate(slides_funcs):
-            if progress_callback:
-                progress = int(20 + (i / total) * 70)
-                progress_callback(name, progress, 100, f"📄 {name}")
-            func()
+        # 이미지는 먼저 병렬로 받아 두고 슬라이드 조작은 단일 스레드에서
+        self._prewarm_images()
+        
+        self._build_all_slides(progress_callback, 20, 90)
         
         if progress_callback:
             progress_callback("슬라이드 생성 완료", 95, 100, "저장 중...")
     
+    def _save(self, output: Optional[BinaryIO] = None) -> BinaryIO:
+        """PPT 저장 (일정 크기까지는 메모리, 초과분은 임시 파일에 기록)"""
+        ppt_buffer = output if output is not None else tempfile.SpooledTemporaryFile(max_size=config.PPT_SPOOL_MAX_SIZE)
+        self.ppt.save(ppt_buffer)
+        ppt_buffer.seek(0)
+        return ppt_buffer
+    
+    def _load_text_assets(self):
+        """텍스트 에셋 로드 (오브젝트형 에셋은 셀 조회가 빠르도록 소재별 dict로 변환)"""
+        self.text_assets, self.df_obj_result = self.sheets.get_bundle(self.materials[0], self.materials)
+        self._obj = self.df_obj_result.to_dict(orient="index")
+        
+        # 줄바꿈 텍스트는 컬럼 단위로 한 번에 계산 (pandas 문자열 연산)
+        wrapped = pd.DataFrame(index=self.df_obj_result.index)
+        for column, max_chars in WRAP_COLUMNS.items():
+            text = self.df_obj_result[column].astype(str)
+            wrapped[column] = (text.str.slice(0, max_chars) + "\n" + text.str.slice(max_chars)).where(
+                text.str.len() > max_chars, text)
+        self._wrapped = wrapped.to_dict(orient="index")
+    
     def _load_template(self):
         """PPT 템플릿 로드"""
-        # 로컬 템플릿 파일 사용 (Dropbox에서 다운로드도 가능)
-        if config.TEMPLATE_PATH.exists():
-            self.ppt = Presentation(str(config.TEMPLATE_PATH))
+        # 로컬 템플릿 파일 사용 (Dropbox에서 다운로드도 가능, 파일은 모듈 로드 시 한 번만 읽음)
+        if _TEMPLATE_BYTES is not None:
+            self.ppt = Presentation(BytesIO(_TEMPLATE_BYTES))
         else:
             # 빈 프레젠테이션 생성 (폴백)
             self.ppt = Presentation()
     
-    def _add_image_from_dropbox(self, slide, material: str, size: str, 
-                                 left: float, top: float, width: float, height: float) -> bool:
-        """Dropbox에서 이미지 다운로드 후 슬라이드에 추가"""
-        try:
-            img_bytes = self.dropbox.download_image(material, size)
-            if img_bytes:
-                slide.shapes.add_picture(img_bytes, Cm(left), Cm(top), 
-                                        width=Cm(width), height=Cm(height))
-                return True
-        except Exception as e:
-            print(f"Error adding image {material}/{size}: {e}")
-        return False
+    def _prewarm_images(self, progress_callback: Optional[Callable] = None,
+                        loop: Optional[asyncio.AbstractEventLoop] = None):
+        """
+        슬라이드에 들어갈 (소재, 사이즈) 이미지를 일괄 다운로드
+        Args:
+            progress_callback: 진행 콜백 (current, total, message)
+            loop: 지정 시 해당 이벤트 루프에서 비동기로 프리로드
+        """
+        pairs = [
+            (material, size)
+            for material in self.materials
+            for size in dict.fromkeys(self.materials_sizes[material])
+            if size in config.PPT_IMAGE_SIZES
+        ]
+        
+        # 다운로드는 Dropbox 클라이언트에서 병렬로 처리하고 슬라이드 조작은 이후 순차 진행
+        if loop is not None:
+            self.images = asyncio.run_coroutine_threadsafe(
+                self.dropbox.download_images_bulk_async(pairs, progress_callback),
+                loop
+            ).result()
+        else:
+            self.images = self.dropbox.download_images_bulk(pairs, progress_callback)
+        self._hash_images()
     
-    # ===== 슬라이드 유형 1: 배너형 =====
-    def _first_create_slides(self):
-        """첫번째 유형: 640x100, 970x250, 160x600"""
-        for i in range(0, len(self.materials), 2):
-            slide = self.ppt.slides.add_slide(self.ppt.slide_layouts[0])
-            
-            # 첫번째 소재
-            material = self.materials[i]
-            sizes = self.materials_sizes[material]
-            
-            # 640x100
-            if '640x100' in sizes:
-                self._add_image_from_dropbox(slide, material, '640x100', 0, 0.7, 18.54, 2.9)
-            
-            # 970x250
-            if '970x250' in sizes:
-                self._add_image_from_dropbox(slide, material, '970x250', 0, 7.38, 18.59, 4.79)
-            
-            # 160x600
-            if '160x600' in sizes:
-                self._add_image_from_dropbox(slide, material, '160x600', 18.61, 0.7, 4.48, 16.8)
-            
-            # 두번째 소재
-            if i + 1 < len(self.materials):
-                material2 = self.materials[i + 1]
-                sizes2 = self.materials_sizes[material2]
-                
-                if '640x100' in sizes2:
-                    self._add_image_from_dropbox(slide, material2, '640x100', 0, 3.94, 18.54, 2.9)
-                
-                if '970x250' in sizes2:
-                    self._add_image_from_dropbox(slide, material2, '970x250', 0, 12.71, 18.59, 4.79)
-                
-                if '160x600' in sizes2:
-                    self._add_image_from_dropbox(slide, material2, '160x600', 23.09, 0.7, 4.48, 16.8)
+    def _hash_images(self):
+        """다운로드한 이미지를 내용 해시로 미리 묶어 둠 (내용이 같은 이미지는 ImagePart 하나를 공유)"""
+        self._image_digests = {
+            key: hashlib.sha256(img_bytes).digest()
+            for key, img_bytes in self.images.items()
+        }
+        self._image_parts = {}
     
-    # ===== 슬라이드 유형 2: 정사각/세로형 =====
-    def _second_create_slides(self):
-        """두번째 유형: 1200x628, 1200x1200, 1200x1500"""
-        for i in range(0, len(self.materials), 2):
-            slide = self.ppt.slides.add_slide(self.ppt.slide_layouts[1])
-            
-            # 첫번째 소재
-            material = self.materials[i]
-            sizes = self.materials_sizes[material]
-            
-            if '1200x628' in sizes:
-                self._add_image_from_dropbox(slide, material, '1200x628', 0, 0.18, 13.86, 7.25)
-            
-            if '1200x1200' in sizes:
-                self._add_image_from_dropbox(slide, material, '1200x1200', 0, 7.62, 7.15, 7.15)
-            
-            if '1200x1500' in sizes:
-                self._add_image_from_dropbox(slide, material, '1200x1500', 7.27, 7.62, 6.4, 8)
-            
-            # 두번째 소재
-            if i + 1 < len(self.materials):
-                material2 = self.materials[i + 1]
-                sizes2 = self.materials_sizes[material2]
-                
-                if '1200x628' in sizes2:
-                    self._add_image_from_dropbox(slide, material2, '1200x628', 13.65, 0.18, 13.86, 7.25)
-                
-                if '1200x1200' in sizes2:
-                    self._add_image_from_dropbox(slide, material2, '1200x1200', 13.65, 7.62, 7.15, 7.15)
-                
-                if '1200x1500' in sizes2:
-                    self._add_image_from_dropbox(slide, material2, '1200x1500', 21.12, 7.62, 6.4, 8)
+    def _add_image_from_dropbox(self, slide, material: str, size: str, 
+                                 left: int, top: int, width: int, height: int) -> bool:
+        """미리 다운로드한 이미지를 슬라이드에 추가 (위치/크기는 EMU)"""
+        digest = self._image_digests.get((material, size))
+        if digest is None:
+            return False
+        
+        image_part = self._image_parts.get(digest)
+        if image_part is None:
+            # 최초 1회만 add_picture와 같은 경로로 파트 생성 (슬라이드와 연결되어야 파트 이름이 중복되지 않음)
+            try:
+                image_part, _ = slide.part.get_or_add_image_part(BytesIO(self.images[(material, size)]))
+            except (OSError, ValueError):  # 이미지 형식을 읽을 수 없는 파일
+                logger.warning("Error adding image: %s/%s", material, size, exc_info=True,
+                               extra={"material": material, "size": size})
+                return False
+            self._image_parts[digest] = image_part
+        
+        self._add_picture_shared(slide, image_part, left, top, width, height)
+        return True
     
-    # ===== 슬라이드 유형 3: 구글 텍스트에셋 =====
-    def _third_create_slides(self):
-        """세번째 유형: 이미지 + 구글 텍스트에셋 테이블"""
-        google_list = self.text_assets.get('google_range_list', [])
-        if not google_list:
-            return
+    def _add_picture_shared(self, slide, image_part, left: int, top: int, width: int, height: int):
+        """이미 생성된 ImagePart를 참조하는 그림 추가 (이미지 파싱/sha1 계산 없이 관계만 추가)"""
+        rId = slide.part.relate_to(image_part, RT.IMAGE)
+        slide.shapes._add_pic_from_image_part(image_part, rId, left, top, width, height)
+    
+    # ===== 슬라이드 생성 =====
+    def _build_all_slides(self, progress_callback: Optional[Callable] = None,
+                          start: int = 0, end: int = 100):
+        """
+        모든 유형의 슬라이드 생성
+        소재 SLIDE_CHUNK개 단위로 여섯 유형을 한 번에 만들고, 끝나면 슬라이드 순서를 유형별로 정렬
+        Args:
+            progress_callback: 콜백(step, current, total, detail)
+            start, end: 진행률 범위 (%)
+        """
+        specs = [
+            spec for spec in SLIDE_LAYOUTS
+            if not spec.get("requires") or self.text_assets.get(spec["requires"])
+        ]
+        sldIdLst = self.ppt.slides._sldIdLst
+        slide_ids: List[List[Any]] = [[] for _ in specs]  # 유형별 sldId 요소
         
-        for i in range(0, len(self.materials), 2):
-            slide = self.ppt.slides.add_slide(self.ppt.slide_layouts[2])
-            
-            # 첫번째 소재
-            material = self.materials[i]
-            sizes = self.materials_sizes[material]
-            
-            if '1200x628' in sizes:
-                self._add_image_from_dropbox(slide, material, '1200x628', 19.15, 8.21, 8.24, 4.31)
-            
-            if '1200x1200' in sizes:
-                self._add_image_from_dropbox(slide, material, '1200x1200', 0, 0.18, 7.15, 7.15)
-            
-            if '1200x1500' in sizes:
-                self._add_image_from_dropbox(slide, material, '1200x1500', 7.27, 0.18, 6.4, 8)
-            
-            # 텍스트 테이블 추가
-            self._add_google_text_tables(slide, google_list)
-            
-            # 두번째 소재
-            if i + 1 < len(self.materials):
-                material2 = self.materials[i + 1]
-                sizes2 = self.materials_sizes[material2]
-                
-                if '1200x628' in sizes2:
-                    self._add_image_from_dropbox(slide, material2, '1200x628', 19.15, 12.53, 8.24, 4.31)
-                
-                if '1200x1200' in sizes2:
-                    self._add_image_from_dropbox(slide, material2, '1200x1200', 13.75, 0.18, 7.15, 7.15)
-                
-                if '1200x1500' in sizes2:
-                    self._add_image_from_dropbox(slide, material2, '1200x1500', 21.12, 0.18, 6.4, 8)
+        chunk_starts = range(0, len(self.materials), SLIDE_CHUNK)
+        for n, offset in enumerate(chunk_starts):
+            chunk = self.materials[offset:offset + SLIDE_CHUNK]
+            if progress_callback:
+                percent = start + int((n / len(chunk_starts)) * (end - start))
+                progress_callback("슬라이드 생성", percent, 100,
+                                  f"📄 {offset + 1}~{offset + len(chunk)}번째 소재 슬라이드 생성 중...")
+            
+            for spec, ids in zip(specs, slide_ids):
+                per_slide = spec["per_slide"]
+                for i in range(0, len(chunk), per_slide):
+                    self._build_slide(spec, chunk[i:i + per_slide])
+                    ids.append(sldIdLst[-1])
+        
+        # 유형별로 모이도록 순서 재배치 (append는 기존 위치에서 이동) 후 슬라이드 파트 이름도 순서대로 정리
+        for ids in slide_ids:
+            for sldId in ids:
+                sldIdLst.append(sldId)
+        self.ppt.part.rename_slide_parts([sldId.rId for sldId in sldIdLst])
+    
+    def _build_slide(self, spec: Dict[str, Any], chunk: List[str]):
+        """배치 정의(SLIDE_LAYOUTS 항목)대로 소재 chunk의 슬라이드 한 장 생성"""
+        slide = self.ppt.slides.add_slide(self.ppt.slide_layouts[spec["layout"]])
+        
+        for item in spec["items"]:
+            if item["col"] >= len(chunk):
+                continue
+            material = chunk[item["col"]]
+            kind = item["type"]
+            
+            if kind == "image":
+                if item["size"] in self.materials_sizes[material]:
+                    self._add_image_from_dropbox(slide, material, item["size"], *item["pos"])
+            elif kind == "text":
+                source = self.materials[0] if item.get("deck_first") else material
+                if "wrap" in item:
+                    text = self._get_wrapped_value(source, item["column"], item["wrap"])
+                else:
+                    text = self._get_obj_value(source, item["column"])
+                if "suffix" in item:
+                    text += item["suffix"]
+                self._add_textbox(slide, *item["pos"], text, item["font_size"])
+            elif kind == "gfa_desc":
+                desc_text = f"{self._get_obj_value(material, '네이버GFA_네이티브_설명문구1')} {self._get_obj_value(material, '네이버GFA_네이티브_설명문구2')}\n {self._get_obj_value(material, '네이버GFA_네이티브_설명문구3')}"
+                self._add_textbox(slide, *item["pos"], desc_text, item["font_size"])
+            elif kind == "meta_text":
+                self._add_meta_text(slide, self.text_assets.get('meta_range_list', []),
+                                    self.text_assets.get('meta_caution', ''), item["left"])
+            elif kind == "toss_text":
+                self._add_toss_moment_text(slide, material, item["left"])
+            elif kind == "google_tables":
+                self._add_google_text_tables(slide, self.text_assets.get('google_range_list', []))
     
     def _add_google_text_tables(self, slide, google_list: List[str]):
         """구글 텍스트에셋 테이블 추가"""
@@ -336,9 +525,9 @@ class PPTGenerator:
                            left: float, top: float, width: float, height: float,
                            texts: List[str]):
         """테이블 생성 및 텍스트 채우기"""
-        table = slide.shapes.add_table(rows, cols, Cm(left), Cm(top), 
-                                       Cm(width), Cm(height)).table
-        table.columns[0].width = Cm(width)
+        left, top, width, height = _emu(left, top, width, height)
+        table = slide.shapes.add_table(rows, cols, left, top, width, height).table
+        table.columns[0].width = width
         
         for i, text in enumerate(texts):
             if i < rows:
@@ -346,217 +535,53 @@ class PPTGenerator:
                 cell.fill.solid()
                 cell.fill.fore_color.rgb = RGBColor(255, 255, 255)
                 p = cell.text_frame.paragraphs[0]
-                p.font.size = Pt(7)
+                p.font.size = 7 * EMU_PER_PT
                 p.font.color.rgb = RGBColor(0, 0, 0)
                 p.text = text if text else ''
     
-    # ===== 슬라이드 유형 4: META/토스 모먼트탭 =====
-    def _fourth_create_slides(self):
-        """네번째 유형: META, 토스 모먼트탭"""
-        meta_list = self.text_assets.get('meta_range_list', [])
-        meta_caution = self.text_assets.get('meta_caution', '')
-        
-        for i in range(0, len(self.materials), 2):
-            slide = self.ppt.slides.add_slide(self.ppt.slide_layouts[3])
-            
-            # 첫번째 소재
-            material = self.materials[i]
-            sizes = self.materials_sizes[material]
-            
-            # 1080x1080
-            if '1080x1080' in sizes:
-                self._add_image_from_dropbox(slide, material, '1080x1080', 0.64, 9.49, 6.63, 6.63)
-            
-            # META 텍스트
-            self._add_meta_text(slide, meta_list, meta_caution, 0.64)
-            
-            # 1200x1200_toss
-            if '1200x1200_toss' in sizes:
-                self._add_image_from_dropbox(slide, material, '1200x1200_toss', 15.14, 0.5, 5.41, 5.41)
-            
-            # 토스 모먼트탭 텍스트
-            self._add_toss_moment_text(slide, material, 15.14)
-            
-            # 두번째 소재
-            if i + 1 < len(self.materials):
-                material2 = self.materials[i + 1]
-                sizes2 = self.materials_sizes[material2]
-                
-                if '1080x1080' in sizes2:
-                    self._add_image_from_dropbox(slide, material2, '1080x1080', 7.81, 9.49, 6.63, 6.63)
-                
-                self._add_meta_text(slide, meta_list, meta_caution, 7.81)
-                
-                if '1200x1200_toss' in sizes2:
-                    self._add_image_from_dropbox(slide, material2, '1200x1200_toss', 21.47, 0.5, 5.41, 5.41)
-                
-                self._add_toss_moment_text(slide, material2, 21.47)
-    
-    def _add_meta_text(self, slide, meta_list: List[str], meta_caution: str, left: float):
-        """META 텍스트 추가"""
+    def _add_meta_text(self, slide, meta_list: List[str], meta_caution: str, left: int):
+        """META 텍스트 추가 (left는 EMU)"""
         # 본문
         if len(meta_list) >= 7:
             body_text = '\n'.join(meta_list[1:7])
-            self._add_textbox(slide, left, 0.8, 6.52, 4, body_text, 7.5)
+            self._add_textbox(slide, left, *_emu(0.8, 6.52, 4), body_text, 7.5)
         
         # 유의문구
         if meta_caution:
             caution_wrapped = self._add_newlines(meta_caution, 28)
-            self._add_textbox(slide, left, 2.8, 6.52, 4, caution_wrapped, 7.5)
+            self._add_textbox(slide, left, *_emu(2.8, 6.52, 4), caution_wrapped, 7.5)
         
         # 제목
         if meta_list:
-            self._add_textbox(slide, left, 16.14, 6.52, 2, meta_list[0], 9)
-    
-    def _add_toss_moment_text(self, slide, material: str, left: float):
-        """토스 모먼트탭 텍스트 추가"""
-        try:
-            text1 = self.df_obj_result.loc[material, "토스_모먼트탭_메인문구1"]
-            text2 = self.df_obj_result.loc[material, "토스_모먼트탭_메인문구2"]
-            text3 = self.df_obj_result.loc[material, "토스_모먼트탭_보조문구"]
-            full_text = f"{text1}\n{text2}\n{text3}"
-            self._add_textbox(slide, left, 6.18, 5.5, 5.88, full_text, 10, 
-                            font_color=RGBColor(255, 255, 255))
-        except:
-            pass
-    
-    # ===== 슬라이드 유형 5: 오브젝트형 =====
-    def _fifth_create_slides(self):
-        """다섯번째 유형: 카카오/네이버/토스/당근"""
-        for material in self.materials:
-            slide = self.ppt.slides.add_slide(self.ppt.slide_layouts[4])
-            sizes = self.materials_sizes[material]
-            
-            # 카카오 비즈보드
-            self._add_textbox(slide, 1.89, 4.25, 7, 0.92,
-                            self._get_obj_value(material, "카카오_비즈보드_메인카피"), 14)
-            self._add_textbox(slide, 1.89, 5.0, 7, 0.92,
-                            self._get_obj_value(material, "카카오_비즈보드_서브카피"), 12)
-            
-            if '315x258' in sizes:
-                self._add_image_from_dropbox(slide, material, '315x258', 9.9, 4, 3, 2.3)
-            
-            # 몰로코 비즈보드
-            self._add_textbox(slide, 14.7, 4.25, 7, 0.92,
-                            self._get_obj_value(material, "카카오_비즈보드(몰로코,애피어)_메인카피"), 14)
-            
-            if '315x258' in sizes:
-                self._add_image_from_dropbox(slide, material, '315x258', 22.16, 4.25, 3, 2.3)
-            
-            # 네이버 네이티브
-            self._add_textbox(slide, 1.77, 7.45, 7, 0.92,
-                            self._get_obj_value(material, "네이버GFA_네이티브_광고문구"), 12)
-            self._add_textbox(slide, 6.03, 8.53, 7, 0.92,
-                            self._get_obj_value(material, "네이버GFA_네이티브_설명문구1"), 10)
-            self._add_textbox(slide, 6.03, 9.03, 7, 0.92,
-                            self._get_obj_value(material, "네이버GFA_네이티브_설명문구2"), 10)
-            self._add_textbox(slide, 6.03, 9.53, 7, 0.92,
-                            self._get_obj_value(material, "네이버GFA_네이티브_설명문구3"), 10)
-            
-            if '342x228' in sizes:
-                self._add_image_from_dropbox(slide, material, '342x228', 1.93, 9, 4, 2.62)
-            
-            # 네이버 커뮤니케이션애드
-            text1 = self._add_newlines(self._get_obj_value(material, "네이버GFA_커뮤니케이션애드_광고문구1"), 23)
-            self._add_textbox(slide, 12.5, 7.57, 7, 0.92, text1, 9.5)
-            
-            if '112x112' in sizes:
-                self._add_image_from_dropbox(slide, material, '112x112', 20.21, 8.27, 1.77, 1.77)
-            
-            text2 = self._add_newlines(self._get_obj_value(material, "네이버GFA_커뮤니케이션애드_광고문구2"), 23)
-            self._add_textbox(slide, 13.79, 10.95, 8, 0.92, text2, 9.5)
-            
-            # 토스 혜택탭
-            if '200x200_toss' in sizes:
-                self._add_image_from_dropbox(slide, material, '200x200_toss', 1.87, 14.33, 1.27, 1.27)
-            
-            self._add_textbox(slide, 3.15, 13.34, 7, 0.92,
-                            self._get_obj_value(material, "토스_혜택탭_메인문구"), 13)
-            sub_text = self._get_obj_value(material, "토스_혜택탭_보조문구") + " AD"
-            self._add_textbox(slide, 3.15, 13.94, 7, 0.92, sub_text, 11.5)
-            
-            # 당근 네이티브
-            if '1200x1200_당근' in sizes:
-                self._add_image_from_dropbox(slide, material, '1200x1200_당근', 14.0, 14.46, 2.9, 2.9)
-            
-            title = self._add_newlines(self._get_obj_value(material, "당근_당근네이티브_광고 제목"), 20)
-            self._add_textbox(slide, 17.28, 13.46, 7, 1.05, title, 13.5)
-            
-            caution = self._add_newlines(self._get_obj_value(material, "당근_당근네이티브_심의필 문구"), 20)
-            self._add_textbox(slide, 17.28, 15.29, 7, 1.05, caution, 8)
+            self._add_textbox(slide, left, *_emu(16.14, 6.52, 2), meta_list[0], 9)
     
-    # ===== 슬라이드 유형 6: 버즈빌/스페셜DA/GFA홈피드 =====
-    def _sixth_create_slides(self):
-        """여섯번째 유형: 버즈빌, 스페셜DA, GFA홈피드"""
-        for i in range(0, len(self.materials), 2):
-            slide = self.ppt.slides.add_slide(self.ppt.slide_layouts[9])
-            
-            # 버즈빌 텍스트
-            self._add_textbox(slide, 2.72, 2.36, 6, 2,
-                            self._get_obj_value(self.materials[0], "버즈빌_카카오금융_광고 제목"), 9)
-            
-            # 첫번째 소재
-            material = self.materials[i]
-            sizes = self.materials_sizes[material]
-            
-            if '1200x627_CTAx' in sizes:
-                self._add_image_from_dropbox(slide, material, '1200x627_CTAx', 2.72, 4.98, 10.34, 5.4)
-            
-            # 스페셜DA 텍스트
-            self._add_textbox(slide, 16.64, 1.75, 4.5, 2,
-                            self._get_obj_value(material, "카카오_비즈보드_메인카피"), 7.5)
-            self._add_textbox(slide, 16.64, 2.4, 4.5, 2,
-                            self._get_obj_value(material, "카카오_비즈보드_서브카피"), 7.5)
-            
-            if '315x258' in sizes:
-                self._add_image_from_dropbox(slide, material, '315x258', 21.57, 2.04, 2.43, 2)
-            
-            # GFA 홈피드
-            self._add_textbox(slide, 13.76, 6.8, 7, 2,
-                            self._get_obj_value(material, "네이버GFA_네이티브_광고문구"), 7)
-            
-            desc_text = f"{self._get_obj_value(material, '네이버GFA_네이티브_설명문구1')} {self._get_obj_value(material, '네이버GFA_네이티브_설명문구2')}\n {self._get_obj_value(material, '네이버GFA_네이티브_설명문구3')}"
-            self._add_textbox(slide, 13.76, 7.15, 5.94, 2, desc_text, 7.5)
-            
-            if '1200x1200' in sizes:
-                self._add_image_from_dropbox(slide, material, '1200x1200', 13.61, 9.08, 6.1, 6.1)
-            
-            # 두번째 소재
-            if i + 1 < len(self.materials):
-                material2 = self.materials[i + 1]
-                sizes2 = self.materials_sizes[material2]
-                
-                if '1200x627_CTAx' in sizes2:
-                    self._add_image_from_dropbox(slide, material2, '1200x627_CTAx', 2.72, 10.63, 10.34, 5.4)
-                
-                self._add_textbox(slide, 16.64, 3.93, 4.5, 2,
-                                self._get_obj_value(material2, "카카오_비즈보드_메인카피"), 7.5)
-                self._add_textbox(slide, 16.64, 4.58, 4.5, 2,
-                                self._get_obj_value(material2, "카카오_비즈보드_서브카피"), 7.5)
-                
-                if '315x258' in sizes2:
-                    self._add_image_from_dropbox(slide, material2, '315x258', 21.57, 4.23, 2.43, 2)
-                
-                self._add_textbox(slide, 20.2, 6.8, 7, 2,
-                                self._get_obj_value(material2, "네이버GFA_네이티브_광고문구"), 7)
-                
-                desc_text2 = f"{self._get_obj_value(material2, '네이버GFA_네이티브_설명문구1')} {self._get_obj_value(material2, '네이버GFA_네이티브_설명문구2')}\n {self._get_obj_value(material2, '네이버GFA_네이티브_설명문구3')}"
-                self._add_textbox(slide, 20.2, 7.15, 5.94, 2, desc_text2, 7.5)
-                
-                if '1200x1200' in sizes2:
-                    self._add_image_from_dropbox(slide, material2, '1200x1200', 20.2, 9.08, 6.1, 6.1)
+    def _add_toss_moment_text(self, slide, material: str, left: int):
+        """토스 모먼트탭 텍스트 추가 (left는 EMU)"""
+        row = self._obj.get(material)
+        if row is None:
+            return
+        text1, text2, text3 = row["토스_모먼트탭_메인문구1"], row["토스_모먼트탭_메인문구2"], row["토스_모먼트탭_보조문구"]
+        full_text = f"{text1}\n{text2}\n{text3}"
+        self._add_textbox(slide, left, *_emu(6.18, 5.5, 5.88), full_text, 10, 
+                        font_color=RGBColor(255, 255, 255))
     
+
     # ===== 헬퍼 함수들 =====
-    def _add_textbox(self, slide, left: float, top: float, width: float, height: float,
+    def _add_textbox(self, slide, left: int, top: int, width: int, height: int,
                      text: str, font_size: float, font_color: RGBColor = RGBColor(0, 0, 0)):
-        """텍스트박스 추가"""
-        txBox = slide.shapes.add_textbox(Cm(left), Cm(top), Cm(width), Cm(height))
-        tf = txBox.text_frame
-        p = tf.add_paragraph()
-        p.font.size = Pt(font_size)
-        p.font.color.rgb = font_color
-        p.text = text if text else ''
-        p.font.name = "Malgun Gothic"
+        """텍스트박스 추가 (위치/크기는 EMU, 글자 크기는 pt) - 도형 XML을 직접 생성해 추가"""
+        shapes = slide.shapes
+        shape_id = shapes._next_shape_id
+        xml = TEXTBOX_TEMPLATE.format(
+            id=shape_id, name_id=shape_id - 1,
+            x=left, y=top, cx=width, cy=height,
+            runs=_text_runs_xml(
+                text if text else '',
+                sz=int(font_size * EMU_PER_PT) // 127,  # centipoints
+                rgb=str(font_color),
+            ),
+        )
+        shapes._spTree.insert_element_before(parse_xml(xml), "p:extLst")
     
     def _add_newlines(self, text: str, max_chars: int) -> str:
         """지정된 글자수에서 줄바꿈 추가"""
@@ -564,15 +589,22 @@ class PPTGenerator:
             return text
         return text[:max_chars] + '\n' + text[max_chars:]
     
+    def _get_wrapped_value(self, material: str, column: str, max_chars: int) -> str:
+        """줄바꿈된 오브젝트형 에셋 값 (미리 계산된 값이 없으면 직접 줄바꿈)"""
+        row = self._wrapped.get(material)
+        if row is not None and column in row:
+            return row[column]
+        return self._add_newlines(self._get_obj_value(material, column), max_chars)
+    
     def _get_obj_value(self, material: str, column: str) -> str:
-        """DataFrame에서 값 가져오기"""
-        try:
-            return str(self.df_obj_result.loc[material, column])
-        except:
+        """오브젝트형 에셋 값 가져오기 (시트에 없는 소재는 빈 문자열, 잘못된 컬럼명은 KeyError)"""
+        row = self._obj.get(material)
+        if row is None:
             return ''
+        return str(row[column])
 
 
-def generate_ppt(keyword: str) -> BytesIO:
+def generate_ppt(keyword: str) -> BinaryIO:
     """PPT 생성 편의 함수"""
     generator = PPTGenerator()
     return generator.generate(keyword)
@@ -2,27 +2,104 @@
 Google Sheets API 클라이언트 모듈
 """
 import gspread
+from gspread.utils import absolute_range_name, extract_id_from_url, fill_gaps
 from google.oauth2.service_account import Credentials
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import numpy as np
 import pandas as pd
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Tuple
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from threading import Lock
+from cachetools import TTLCache
 import os
+import re
+import sys
 import json
+import logging
+import pickle
 
 from . import config
 
+logger = logging.getLogger(__name__)
+
+# 서비스 계정 JSON 파일 (모듈 로드 시 한 번만 탐색)
+CREDENTIALS_FILE: Optional[Path] = next(config.CREDENTIALS_DIR.glob("*.json"), None)
+
+# 셀 값 → 시트 번호 → 열 → 행 목록 (시트/열/행 모두 오름차순)
+CellIndex = Dict[str, Dict[int, Dict[int, List[int]]]]
+
+# 로드된 스프레드시트 (시트별 2차원 object 배열, 셀 색인, 오브젝트 시트별 (시트 열, 결과 컬럼 번호) 목록)
+SheetData = Tuple[List[np.ndarray], CellIndex, List[List[Tuple[int, int]]]]
+
+# 셀 문자열 intern (반복되는 키워드/빈 값이 같은 객체를 공유해 메모리 절약, 비교 시 동일 객체 확인으로 끝남)
+_intern_cells = np.frompyfunc(sys.intern, 1, 1)
+
+# 디스크 스냅샷 형식 버전 (캐시에 저장하는 데이터 구조가 바뀌면 증가)
+SNAPSHOT_VERSION = 3
+
+# 오브젝트형 에셋 결과 컬럼
+OBJECT_COLUMNS = [
+    "카카오_비즈보드_메인카피",
+    "카카오_비즈보드_서브카피",
+    "카카오_비즈보드(몰로코,애피어)_메인카피",
+    "토스_혜택탭_메인문구",
+    "토스_혜택탭_보조문구",
+    "토스_모먼트탭_메인문구1",
+    "토스_모먼트탭_메인문구2",
+    "토스_모먼트탭_보조문구",
+    "네이버GFA_네이티브_광고문구",
+    "네이버GFA_네이티브_설명문구1",
+    "네이버GFA_네이티브_설명문구2",
+    "네이버GFA_네이티브_설명문구3",
+    "네이버GFA_커뮤니케이션애드_광고문구1",
+    "네이버GFA_커뮤니케이션애드_광고문구2",
+    "당근_당근네이티브_광고 제목",
+    "당근_당근네이티브_심의필 문구",
+    "버즈빌_카카오금융_광고 제목",
+]
+
+OBJECT_COLUMN_INDEX = {name: i for i, name in enumerate(OBJECT_COLUMNS)}
+
+# 플랫폼 키워드 → 키워드 열부터 차례로 읽을 결과 컬럼 (None은 건너뛰는 열)
+PLATFORM_KEYWORDS = {
+    "비즈보드": ["카카오_비즈보드_메인카피", "카카오_비즈보드_서브카피"],
+    "비즈보드(몰로코,애피어)": ["카카오_비즈보드(몰로코,애피어)_메인카피"],
+    "혜택탭": ["토스_혜택탭_메인문구", "토스_혜택탭_보조문구"],
+    "모먼트탭": ["토스_모먼트탭_메인문구1", "토스_모먼트탭_메인문구2", "토스_모먼트탭_보조문구"],
+    "네이티브": ["네이버GFA_네이티브_광고문구", "네이버GFA_네이티브_설명문구1", 
+              "네이버GFA_네이티브_설명문구2", "네이버GFA_네이티브_설명문구3"],
+    "커뮤니케이션애드 (=콘텍스트)": ["네이버GFA_커뮤니케이션애드_광고문구1", "네이버GFA_커뮤니케이션애드_광고문구2"],
+    "당근 네이티브": ["당근_당근네이티브_광고 제목", None, "당근_당근네이티브_심의필 문구"],
+    "버즈빌 카카오 금융": ["버즈빌_카카오금융_광고 제목"],
+}
+
+# 스프레드시트별 기준 셀 값 (하나도 없는 시트는 소재 데이터가 없으므로 캐시하지 않음)
+SHEET_ANCHORS = {
+    "main": frozenset(["구글 AC", "META"]),
+    "object": frozenset(PLATFORM_KEYWORDS),
+}
+
 
 class SheetsClient:
     """Google Sheets API 클라이언트"""
     
     def __init__(self):
         self.gc = self._authorize()
-        self._df_cache: Dict[str, List[pd.DataFrame]] = {}
-        self._df_obj_cache: Dict[str, List[pd.DataFrame]] = {}
+        # 스프레드시트 캐시 (개수 제한 및 만료 후 재로드, 수정되지 않았으면 디스크 스냅샷 사용)
+        self._sheet_cache: TTLCache = TTLCache(maxsize=len(SHEET_ANCHORS), ttl=config.SHEETS_CACHE_TTL)
+        self._cache_lock = Lock()
+        # 같은 스프레드시트를 동시에 중복 로드하지 않도록 캐시 키별 잠금
+        self._load_locks: Dict[str, Lock] = {cache_key: Lock() for cache_key in SHEET_ANCHORS}
     
     def _authorize(self) -> gspread.Client:
         """Google Sheets 인증 (파일 또는 환경변수)"""
-        scope = ['https://spreadsheets.google.com/feeds']
+        scope = [
+            'https://spreadsheets.google.com/feeds',
+            'https://www.googleapis.com/auth/drive.metadata.readonly',  # 스냅샷 캐시용 수정 시각 조회
+        ]
         
         # 1. 환경변수에서 credentials 확인
         credentials_json = os.getenv("GOOGLE_CREDENTIALS")
@@ -30,35 +107,198 @@ class SheetsClient:
             try:
                 creds_dict = json.loads(credentials_json)
                 credentials = Credentials.from_service_account_info(creds_dict, scopes=scope)
-                return gspread.authorize(credentials)
-            except Exception as e:
-                print(f"Error loading credentials from env: {e}")
+                return self._tune_session(gspread.authorize(credentials))
+            except Exception:
+                logger.warning("Error loading credentials from env: GOOGLE_CREDENTIALS", exc_info=True)
         
         # 2. 파일에서 credentials 확인
-        json_files = list(config.CREDENTIALS_DIR.glob("*.json"))
-        if json_files:
-            json_file = json_files[0]
-            credentials = Credentials.from_service_account_file(str(json_file), scopes=scope)
-            return gspread.authorize(credentials)
+        if CREDENTIALS_FILE is not None:
+            credentials = Credentials.from_service_account_file(str(CREDENTIALS_FILE), scopes=scope)
+            return self._tune_session(gspread.authorize(credentials))
         
         raise FileNotFoundError(f"No JSON credentials found in {config.CREDENTIALS_DIR} and GOOGLE_CREDENTIALS env not set")
     
-    def _load_spreadsheet_data(self, url: str, cache_key: str) -> List[pd.DataFrame]:
-        """스프레드시트 데이터 로드 (캐싱)"""
-        if cache_key in self._df_cache:
-            return self._df_cache[cache_key]
+    @staticmethod
+    def _tune_session(gc: gspread.Client) -> gspread.Client:
+        """
+        gspread 세션(AuthorizedSession)에 커넥션 풀 및 재시도 설정
+        (Sheets/Drive/OAuth 호스트별 keep-alive 유지, 동시 로드가 커넥션을 기다리지 않도록 풀 확보)
+        """
+        gc.http_client.session.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504]),
+        ))
+        return gc
+    
+    def _load_spreadsheet_data(self, url: str, cache_key: str) -> SheetData:
+        """스프레드시트 데이터 로드 (메모리 캐시 → 수정 시각 기준 디스크 스냅샷 → API 조회)"""
+        with self._cache_lock:
+            data = self._sheet_cache.get(cache_key)
+        if data is not None:
+            return data
+        
+        with self._load_locks[cache_key]:
+            with self._cache_lock:
+                data = self._sheet_cache.get(cache_key)
+            if data is None:
+                data = self._load_sheets(url, cache_key)
+                with self._cache_lock:
+                    self._sheet_cache[cache_key] = data
+        return data
+    
+    def _load_sheets(self, url: str, cache_key: str) -> SheetData:
+        """디스크 스냅샷 또는 API에서 시트를 읽어 색인 생성"""
+        snapshot_path = self._snapshot_path(url, cache_key)
+        sheets = self._read_snapshot(snapshot_path)
+        fetched = sheets is None
+        if fetched:
+            sheets = self._fetch_worksheets(url)
+        else:
+            sheets = [_intern_cells(sheet) for sheet in sheets]  # 스냅샷에서 읽은 문자열도 intern
+        
+        # 시트별 색인을 만들면서 기준 셀이 없는 시트를 함께 판별 (시트 전체를 따로 다시 훑지 않음)
+        sheet_indexes = [self._build_sheet_index(sheet) for sheet in sheets]
+        kept = [i for i, sheet_index in enumerate(sheet_indexes) if not SHEET_ANCHORS[cache_key].isdisjoint(sheet_index)]
+        sheets = [sheets[i] for i in kept]
+        index = self._merge_sheet_indexes([sheet_indexes[i] for i in kept])
+        if fetched:
+            self._write_snapshot(snapshot_path, cache_key, sheets)
         
+        layout = self._build_object_layout(sheets, index) if cache_key == "object" else []
+        return sheets, index, layout
+    
+    def _build_object_layout(self, sheets: List[np.ndarray], index: CellIndex) -> List[List[Tuple[int, int]]]:
+        """
+        오브젝트 시트별로 읽을 (시트 열, 결과 컬럼 번호) 목록
+        플랫폼 키워드 열부터 차례로 대응하며, 시트 폭을 벗어나는 열은 제외
+        """
+        layout = []
+        for sheet_idx, sheet in enumerate(sheets):
+            pairs = []
+            for keyword, col_names in PLATFORM_KEYWORDS.items():
+                kw_hit = self._find_cell(index, keyword, sheet_idx)
+                if kw_hit is None:
+                    continue
+                for i, col_name in enumerate(col_names):
+                    if col_name is not None and kw_hit[2] + i < sheet.shape[1]:
+                        pairs.append((kw_hit[2] + i, OBJECT_COLUMN_INDEX[col_name]))
+            layout.append(pairs)
+        return layout
+    
+    def warmup(self):
+        """두 스프레드시트를 동시에 로드해 캐시를 미리 채움 (앱 시작 시 호출)"""
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(self._load_spreadsheet_data, config.SPREADSHEET_URL, "main"),
+                executor.submit(self._load_spreadsheet_data, config.OBJECT_SPREADSHEET_URL, "object"),
+            ]
+            for future in futures:
+                future.result()
+    
+    def _fetch_worksheets(self, url: str) -> List[np.ndarray]:
+        """전체 워크시트 값을 API로 조회"""
         doc = self.gc.open_by_url(url)
         worksheet_list = doc.worksheets()
         
-        dfs = []
-        for ws in worksheet_list:
-            data = ws.get_all_values()
-            df = pd.DataFrame(data=data)
-            dfs.append(df)
+        # 전체 시트를 한 번의 batchGet으로 조회 (시트마다 get_all_values 왕복 제거)
+        ranges = [absolute_range_name(ws.title) for ws in worksheet_list]
+        response = doc.values_batch_get(ranges)
         
-        self._df_cache[cache_key] = dfs
-        return dfs
+        sheets = []
+        for value_range in response.get("valueRanges", []):
+            data = fill_gaps(value_range.get("values", [[]]))  # get_all_values처럼 직사각형으로 채움
+            sheets.append(_intern_cells(np.array(data, dtype=object)))
+        return sheets
+    
+    def _snapshot_path(self, url: str, cache_key: str) -> Optional[Path]:
+        """스프레드시트 수정 시각(Drive modifiedTime)을 포함한 스냅샷 파일 경로 (조회 실패 시 None)"""
+        try:
+            metadata = self.gc.get_file_drive_metadata(extract_id_from_url(url))
+        except Exception:
+            logger.warning("Error fetching spreadsheet revision: %s", url, exc_info=True)
+            return None
+        revision = re.sub(r"[^0-9A-Za-z]", "", metadata["modifiedTime"])
+        return config.SHEETS_CACHE_DIR / f"{cache_key}-v{SNAPSHOT_VERSION}-{revision}.pkl"
+    
+    @staticmethod
+    def _read_snapshot(path: Optional[Path]) -> Optional[List[np.ndarray]]:
+        """디스크 스냅샷 로드 (없거나 읽기 실패 시 None)"""
+        if path is None or not path.exists():
+            return None
+        try:
+            with open(path, "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            logger.warning("Error reading sheets snapshot: %s", path.name, exc_info=True)
+            return None
+    
+    @staticmethod
+    def _write_snapshot(path: Optional[Path], cache_key: str, sheets: List[np.ndarray]):
+        """디스크 스냅샷 저장 (같은 스프레드시트의 이전 수정본 파일은 삭제)"""
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f:
+                pickle.dump(sheets, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)  # 다른 프로세스가 쓰다 만 파일을 읽지 않도록 교체
+            for old_path in path.parent.glob(f"{cache_key}-*.pkl"):
+                if old_path != path:
+                    old_path.unlink(missing_ok=True)
+        except OSError:
+            logger.warning("Error writing sheets snapshot: %s", path.name, exc_info=True)
+    
+    @staticmethod
+    def _build_sheet_index(sheet: np.ndarray) -> Dict[str, Dict[int, List[int]]]:
+        """시트 하나의 셀 값 → 열 → 행 목록 (빈 셀 제외, 한 번의 순회)"""
+        sheet_index: Dict[str, Dict[int, List[int]]] = {}
+        for col in range(sheet.shape[1]):
+            col_rows: Dict[str, List[int]] = {}
+            for row, value in enumerate(sheet[:, col].tolist()):
+                if value:
+                    col_rows.setdefault(value, []).append(row)
+            for value, rows in col_rows.items():
+                sheet_index.setdefault(value, {})[col] = rows
+        return sheet_index
+    
+    @staticmethod
+    def _merge_sheet_indexes(sheet_indexes: List[Dict[str, Dict[int, List[int]]]]) -> CellIndex:
+        """
+        시트별 색인을 셀 값 → 시트 번호 → 열 → 행 목록으로 합침
+        시트 → 열 → 행 순서로 쌓으므로 첫 위치가 기존 isin 탐색(첫 시트, 왼쪽 열, 위쪽 행)과 같음
+        """
+        index: CellIndex = {}
+        for sheet_idx, sheet_index in enumerate(sheet_indexes):
+            for value, col_rows in sheet_index.items():
+                index.setdefault(value, {})[sheet_idx] = col_rows
+        return index
+    
+    @staticmethod
+    def _find_cell(index: CellIndex, value: str, sheet_idx: Optional[int] = None) -> Optional[Tuple[int, int, int]]:
+        """값이 처음 나오는 (시트 번호, 행, 열) 반환 (sheet_idx 지정 시 해당 시트에서만)"""
+        sheet_hits = index.get(value)
+        if not sheet_hits:
+            return None
+        if sheet_idx is None:
+            sheet_idx = next(iter(sheet_hits))
+        col_hits = sheet_hits.get(sheet_idx)
+        if not col_hits:
+            return None
+        col, rows = next(iter(col_hits.items()))
+        return sheet_idx, rows[0], col
+    
+    @staticmethod
+    def _column_rows(index: CellIndex, value: str, sheet_idx: int, col: int) -> List[int]:
+        """시트의 특정 열에서 값이 나오는 행 번호 목록 (오름차순)"""
+        return index.get(value, {}).get(sheet_idx, {}).get(col, [])
+    
+    @staticmethod
+    def _column_values(worksheet: np.ndarray, row: int, col: int, count: int) -> List[str]:
+        """(row, col)부터 아래로 count개 값 (시트 범위를 벗어나는 칸은 '')"""
+        values = worksheet[row:row + count, col].tolist() if col < worksheet.shape[1] else []
+        return values + [''] * (count - len(values))
     
     def get_text_assets(self, material_name: str) -> Dict[str, Any]:
         """
@@ -69,7 +309,7 @@ class SheetsClient:
             'meta_caution': str          # META 유의문구
         }
         """
-        dfs = self._load_spreadsheet_data(config.SPREADSHEET_URL, "main")
+        sheets, index, _ = self._load_spreadsheet_data(config.SPREADSHEET_URL, "main")
         
         result = {
             'google_range_list': [],
@@ -77,173 +317,93 @@ class SheetsClient:
             'meta_caution': ''
         }
         
-        # 소재명이 있는 시트 찾기
-        worksheet_df = None
-        cell_creative_row = None
-        cell_creative_col = None
-        
-        for df in dfs:
-            find_result = df.isin([material_name])
-            series_result = find_result.any()
-            if series_result.any():
-                worksheet_df = df
-                
-                # 소재 위치 찾기
-                alias_cols = list(series_result[series_result == True].index)
-                for col in alias_cols:
-                    rows = list(find_result[col][find_result[col] == True].index)
-                    if rows:
-                        cell_creative_row = rows[0]
-                        cell_creative_col = col
-                        break
-                break
-        
-        if worksheet_df is None or cell_creative_row is None:
+        # 소재명이 있는 시트 및 위치 찾기
+        hit = self._find_cell(index, material_name)
+        if hit is None:
             return result
+        sheet_idx, cell_creative_row, cell_creative_col = hit
+        worksheet = sheets[sheet_idx]
         
         # 구글 AC 텍스트 추출
         try:
             # "구글 AC" 위치 찾기
-            find_google = worksheet_df.isin(["구글 AC"])
-            series_google = find_google.any()
-            google_cols = list(series_google[series_google == True].index)
+            google_hit = self._find_cell(index, "구글 AC", sheet_idx)
             
-            if google_cols:
-                cell_google_col = google_cols[0]
+            if google_hit:
+                cell_google_col = google_hit[2]
                 
-                # "광고 제목1" 위치 찾기
-                col_data = worksheet_df[cell_google_col][:cell_creative_row + 1]
-                title_rows = col_data.index[col_data == "광고 제목1"]
-                if len(title_rows) > 0:
-                    text_row_address = title_rows[-1]
+                # "광고 제목1" 위치 찾기 (소재 행 이하에서 가장 아래, 행 목록이 정렬돼 있어 이분 탐색)
+                title_rows = self._column_rows(index, "광고 제목1", sheet_idx, cell_google_col)
+                title_pos = bisect_right(title_rows, cell_creative_row)
+                if title_pos > 0:
+                    text_row_address = title_rows[title_pos - 1]
                     
                     # 30개 텍스트 추출
-                    for i in range(30):
-                        try:
-                            text = worksheet_df.iloc[text_row_address + i, cell_google_col + 1]
-                            result['google_range_list'].append(text)
-                        except:
-                            result['google_range_list'].append('')
-        except Exception as e:
-            print(f"Error extracting Google AC text: {e}")
+                    result['google_range_list'] = self._column_values(worksheet, text_row_address, cell_google_col + 1, 30)
+        except Exception:
+            logger.warning("Error extracting Google AC text: %s", material_name, exc_info=True)
         
         # META 텍스트 추출
         try:
-            find_meta = worksheet_df.isin(["META"])
-            series_meta = find_meta.any()
-            meta_cols = list(series_meta[series_meta == True].index)
+            meta_hit = self._find_cell(index, "META", sheet_idx)
             
-            if meta_cols:
-                cell_meta_col = meta_cols[0]
+            if meta_hit:
+                cell_meta_col = meta_hit[2]
                 
-                # "광고 제목" 위치 찾기
-                col_data = worksheet_df[cell_meta_col][:cell_creative_row + 1]
-                title_rows = col_data.index[col_data == "광고 제목"]
-                if len(title_rows) > 0:
-                    text_row_address = title_rows[-1]
+                # "광고 제목" 위치 찾기 (소재 행 이하에서 가장 아래)
+                title_rows = self._column_rows(index, "광고 제목", sheet_idx, cell_meta_col)
+                title_pos = bisect_right(title_rows, cell_creative_row)
+                if title_pos > 0:
+                    text_row_address = title_rows[title_pos - 1]
                     
                     # 8개 텍스트 추출
-                    for i in range(8):
-                        try:
-                            text = worksheet_df.iloc[text_row_address + i, cell_meta_col + 1]
-                            result['meta_range_list'].append(text)
-                        except:
-                            result['meta_range_list'].append('')
+                    result['meta_range_list'] = self._column_values(worksheet, text_row_address, cell_meta_col + 1, 8)
                     
                     # 유의문구 추출
-                    caution_col = worksheet_df[cell_meta_col][text_row_address:]
-                    caution_rows = caution_col.index[caution_col == "유의 문구"]
-                    if len(caution_rows) > 0:
-                        result['meta_caution'] = worksheet_df.iloc[caution_rows[0], cell_meta_col + 1]
-        except Exception as e:
-            print(f"Error extracting META text: {e}")
+                    caution_rows = self._column_rows(index, "유의 문구", sheet_idx, cell_meta_col)
+                    caution_pos = bisect_left(caution_rows, text_row_address)
+                    if caution_pos < len(caution_rows):
+                        result['meta_caution'] = worksheet[caution_rows[caution_pos], cell_meta_col + 1]
+        except Exception:
+            logger.warning("Error extracting META text: %s", material_name, exc_info=True)
         
         return result
     
+    def get_bundle(self, material_name: str, materials: List[str]) -> Tuple[Dict[str, Any], pd.DataFrame]:
+        """
+        텍스트 에셋과 오브젝트형 에셋을 함께 조회
+        (서로 다른 스프레드시트라 한 번의 batchGet으로 묶을 수 없어 동시에 로드)
+        Returns: (get_text_assets 결과, get_object_assets 결과)
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            text_future = executor.submit(self.get_text_assets, material_name)
+            obj_future = executor.submit(self.get_object_assets, materials)
+            return text_future.result(), obj_future.result()
+    
     def get_object_assets(self, materials: List[str]) -> pd.DataFrame:
         """
         오브젝트형 텍스트 에셋 추출
         Returns: DataFrame with columns for each platform
         """
-        dfs = self._load_spreadsheet_data(config.OBJECT_SPREADSHEET_URL, "object")
+        sheets, index, layout = self._load_spreadsheet_data(config.OBJECT_SPREADSHEET_URL, "object")
         
-        columns = [
-            "카카오_비즈보드_메인카피",
-            "카카오_비즈보드_서브카피",
-            "카카오_비즈보드(몰로코,애피어)_메인카피",
-            "토스_혜택탭_메인문구",
-            "토스_혜택탭_보조문구",
-            "토스_모먼트탭_메인문구1",
-            "토스_모먼트탭_메인문구2",
-            "토스_모먼트탭_보조문구",
-            "네이버GFA_네이티브_광고문구",
-            "네이버GFA_네이티브_설명문구1",
-            "네이버GFA_네이티브_설명문구2",
-            "네이버GFA_네이티브_설명문구3",
-            "네이버GFA_커뮤니케이션애드_광고문구1",
-            "네이버GFA_커뮤니케이션애드_광고문구2",
-            "당근_당근네이티브_광고 제목",
-            "당근_당근네이티브_심의필 문구",
-            "버즈빌_카카오금융_광고 제목",
-        ]
+        # 결과는 object 배열에 채운 뒤 마지막에 한 번만 DataFrame으로 감쌈 (.loc 셀 단위 쓰기 제거)
+        out = np.empty((len(materials), len(OBJECT_COLUMNS)), dtype=object)
+        out.fill('')
         
-        df_result = pd.DataFrame(index=materials, columns=columns)
-        
-        for material in materials:
-            worksheet_df = None
-            cell_creative_row = None
-            
-            # 소재명이 있는 시트 찾기
-            for df in dfs:
-                find_result = df.isin([material])
-                series_result = find_result.any()
-                if series_result.any():
-                    worksheet_df = df
-                    alias_cols = list(series_result[series_result == True].index)
-                    for col in alias_cols:
-                        rows = list(find_result[col][find_result[col] == True].index)
-                        if rows:
-                            cell_creative_row = rows[0]
-                            break
-                    break
-            
-            if worksheet_df is None or cell_creative_row is None:
+        for mat_idx, material in enumerate(materials):
+            # 소재명이 있는 시트 및 위치 찾기
+            hit = self._find_cell(index, material)
+            if hit is None:
                 continue
+            sheet_idx, cell_creative_row, _ = hit
+            worksheet = sheets[sheet_idx]
             
-            # 각 플랫폼별 텍스트 추출
-            platform_keywords = {
-                "비즈보드": ["카카오_비즈보드_메인카피", "카카오_비즈보드_서브카피"],
-                "비즈보드(몰로코,애피어)": ["카카오_비즈보드(몰로코,애피어)_메인카피"],
-                "혜택탭": ["토스_혜택탭_메인문구", "토스_혜택탭_보조문구"],
-                "모먼트탭": ["토스_모먼트탭_메인문구1", "토스_모먼트탭_메인문구2", "토스_모먼트탭_보조문구"],
-                "네이티브": ["네이버GFA_네이티브_광고문구", "네이버GFA_네이티브_설명문구1", 
-                          "네이버GFA_네이티브_설명문구2", "네이버GFA_네이티브_설명문구3"],
-                "커뮤니케이션애드 (=콘텍스트)": ["네이버GFA_커뮤니케이션애드_광고문구1", "네이버GFA_커뮤니케이션애드_광고문구2"],
-                "당근 네이티브": ["당근_당근네이티브_광고 제목", None, "당근_당근네이티브_심의필 문구"],
-                "버즈빌 카카오 금융": ["버즈빌_카카오금융_광고 제목"],
-            }
-            
-            for keyword, col_names in platform_keywords.items():
-                try:
-                    find_kw = worksheet_df.isin([keyword])
-                    series_kw = find_kw.any()
-                    kw_cols = list(series_kw[series_kw == True].index)
-                    
-                    if kw_cols:
-                        cell_kw_col = kw_cols[0]
-                        
-                        for i, col_name in enumerate(col_names):
-                            if col_name is not None:
-                                try:
-                                    value = worksheet_df.iloc[cell_creative_row - 1, cell_kw_col + i]
-                                    df_result.loc[material, col_name] = value
-                                except:
-                                    pass
-                except Exception as e:
-                    print(f"Error extracting {keyword}: {e}")
+            # 각 플랫폼별 텍스트 추출 (키워드 열부터 소재 윗행 값)
+            for sheet_col, out_col in layout[sheet_idx]:
+                out[mat_idx, out_col] = worksheet[cell_creative_row - 1, sheet_col]
         
-        df_result.fillna('', inplace=True)
-        return df_result
+        return pd.DataFrame(out, index=materials, columns=OBJECT_COLUMNS)
 
 
 # 싱글톤 인스턴스
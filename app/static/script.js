@@ -56,7 +56,7 @@ document.addEventListener('DOMContentLoaded', function () {
             }
 
             allMaterials = data.details;
-            displayMaterials(data.materials, data.details);
+            displayMaterials(Object.keys(data.details), data.details);
 
             // UI 전환
             loadSection.style.display = 'none';